@@ -0,0 +1,44 @@
+"""Partial indexes for soft-delete read paths
+
+Revision ID: 002_soft_delete_partial_indexes
+Revises: 001_initial_schema
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '002_soft_delete_partial_indexes'
+down_revision = '001_initial_schema'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # forms: every read path filters deleted_at IS NULL
+    op.create_index(
+        'idx_forms_alive', 'forms', ['id'],
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+    op.create_index(
+        'idx_forms_alive_created', 'forms', [sa.text('created_at DESC')],
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+    op.create_index(
+        'idx_forms_alive_status_created', 'forms', ['status', sa.text('created_at DESC')],
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+    # roles: get_role_by_name / get_all_system_roles only read active, live roles
+    op.create_index(
+        'idx_roles_alive_name', 'roles', ['name'],
+        postgresql_where=sa.text('deleted_at IS NULL AND is_active'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_roles_alive_name', table_name='roles')
+    op.drop_index('idx_forms_alive_status_created', table_name='forms')
+    op.drop_index('idx_forms_alive_created', table_name='forms')
+    op.drop_index('idx_forms_alive', table_name='forms')
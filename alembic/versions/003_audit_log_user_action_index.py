@@ -0,0 +1,27 @@
+"""Composite index for per-user audit lookups by action
+
+Revision ID: 003_audit_log_user_action_index
+Revises: 002_soft_delete_partial_indexes
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '003_audit_log_user_action_index'
+down_revision = '002_soft_delete_partial_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # audit_log: newest entries of one action for a user (permission checks, logins)
+    op.create_index(
+        'idx_audit_log_user_action_date', 'audit_log',
+        ['user_id', 'action', sa.text('created_at DESC')],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_audit_log_user_action_date', table_name='audit_log')
@@ -0,0 +1,32 @@
+"""Add id to the live-forms created_at index for keyset pagination
+
+Revision ID: 004_forms_keyset_index
+Revises: 003_audit_log_user_action_index
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '004_forms_keyset_index'
+down_revision = '003_audit_log_user_action_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # forms: keyset pages seek on (created_at, id) < cursor, newest first
+    op.drop_index('idx_forms_alive_created', table_name='forms')
+    op.create_index(
+        'idx_forms_alive_created', 'forms', [sa.text('created_at DESC'), sa.text('id DESC')],
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_forms_alive_created', table_name='forms')
+    op.create_index(
+        'idx_forms_alive_created', 'forms', [sa.text('created_at DESC')],
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
@@ -0,0 +1,27 @@
+"""Partial index for category-filtered form lists
+
+Revision ID: 005_forms_category_index
+Revises: 004_forms_keyset_index
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005_forms_category_index'
+down_revision = '004_forms_keyset_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # forms: list_forms filtered by category, newest first
+    op.create_index(
+        'idx_forms_alive_category_created', 'forms', ['category', sa.text('created_at DESC')],
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_forms_alive_category_created', table_name='forms')
@@ -8,23 +8,27 @@ This module provides:
 4. Audit logging for permission checks
 """
 
-from typing import Optional, List, Set, Callable, Any
-from functools import wraps
+from typing import Optional, List, FrozenSet, Dict, Tuple, Callable, Any, Iterable
+from functools import wraps, lru_cache
 from datetime import datetime
+import time
 
 from fastapi import Depends, HTTPException, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from backend.database import get_db
 from backend.auth.jwt_handler import TokenData
 from backend.auth.permissions import (
     Permission,
+    PERMISSION_VALUES,
     DEFAULT_ROLES,
     get_inherited_permissions,
     get_permission_for_resource_action,
     RESOURCE_ACTION_PERMISSIONS,
 )
 from backend.models import User, Role, UserRole, AuditLog
+from backend.services.audit_queue import audit_queue
 
 
 # Lazy import to avoid circular dependency
@@ -35,41 +39,152 @@ def _get_current_user():
 # PERMISSION CHECKING FUNCTIONS
 # ============================================================================
 
-async def get_user_permissions(user_id: str, db: Session) -> Set[str]:
+# Short-lived cache of resolved permissions so the several checks made while
+# handling one request share a single lookup. Entries are keyed on user id
+# and tagged with the roles epoch, which is bumped when role definitions change.
+PERMISSION_CACHE_TTL = 2.0  # seconds
+PERMISSION_CACHE_MAX_SIZE = 1024
+_permission_cache: Dict[str, Tuple[int, float, FrozenSet[str]]] = {}
+_roles_epoch = 0
+
+
+def invalidate_permission_cache(user_id: Optional[str] = None) -> None:
+    """
+    Drop cached permissions after a role change.
+    
+    Args:
+        user_id: UUID of the user whose roles changed; if omitted, all
+                 cached entries are invalidated (e.g. a role's permissions changed)
+    """
+    global _roles_epoch
+    if user_id is None:
+        _roles_epoch += 1
+        _permission_cache.clear()
+    else:
+        _permission_cache.pop(str(user_id), None)
+
+
+# Full permission set granted to the admin role
+ALL_PERMISSIONS: FrozenSet[str] = frozenset(PERMISSION_VALUES.values())
+
+
+def _user_roles_query():
+    """Select (user id, role name, role permissions) for live, active role assignments."""
+    return select(UserRole.user_id, Role.name, Role.permissions).join(
+        UserRole, UserRole.role_id == Role.id
+    ).where(
+        UserRole.deleted_at.is_(None),
+        Role.is_active.is_(True),
+        Role.deleted_at.is_(None),
+    )
+
+
+def _resolve_permissions(roles: List[Tuple[str, Any]]) -> FrozenSet[str]:
+    """Merge (role name, permissions) pairs into a user's effective permissions."""
+    # Admins are allowed everything; skip merging their permission lists
+    if any(role_name == "admin" for role_name, _ in roles):
+        return ALL_PERMISSIONS
+    
+    # Permissions are stored as a list (or a dict keyed by permission);
+    # iterating either yields permission strings, so union them in one pass
+    all_permissions = set().union(*(
+        perms for _, perms in roles if isinstance(perms, (list, dict))
+    ))
+    
+    # Apply inheritance rules
+    return get_inherited_permissions(all_permissions)
+
+
+def _load_user_permissions(user_id: str, db: Session) -> FrozenSet[str]:
+    """Query the database for a user's permissions including inherited ones."""
+    # Permissions of all live, active roles assigned to the user in one query
+    # (no user_roles rows means an unknown user, which yields no permissions)
+    rows = db.execute(
+        _user_roles_query().where(UserRole.user_id == user_id)
+    ).all()
+    return _resolve_permissions([(role_name, perms) for _, role_name, perms in rows])
+
+
+def _cache_permissions(key: str, now: float, permissions: FrozenSet[str]) -> None:
+    """Store resolved permissions in the cache under the current roles epoch."""
+    if len(_permission_cache) >= PERMISSION_CACHE_MAX_SIZE:
+        _permission_cache.clear()
+    _permission_cache[key] = (_roles_epoch, now, permissions)
+
+
+async def get_user_permissions(user_id: str, db: Session) -> FrozenSet[str]:
     """
     Get all permissions for a user including inherited permissions.
     
+    Results are cached for PERMISSION_CACHE_TTL seconds.
+    
     Args:
         user_id: UUID of the user
         db: Database session
         
     Returns:
-        Set of permission strings the user has
+        Frozen set of permission strings the user has
     """
-    # Get user with roles
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        return set()
+    key = str(user_id)
+    now = time.monotonic()
+    cached = _permission_cache.get(key)
+    if cached is not None:
+        epoch, cached_at, permissions = cached
+        if epoch == _roles_epoch and now - cached_at < PERMISSION_CACHE_TTL:
+            return permissions
     
-    # Collect all permissions from all roles
-    all_permissions = set()
-    user_roles = db.query(UserRole).filter(
-        UserRole.user_id == user_id,
-        UserRole.deleted_at.is_(None)
-    ).all()
+    permissions = _load_user_permissions(user_id, db)
+    _cache_permissions(key, now, permissions)
+    
+    return permissions
+
+
+async def get_users_permissions(
+    user_ids: Iterable[str],
+    db: Session
+) -> Dict[str, FrozenSet[str]]:
+    """
+    Get permissions for several users with a single query.
     
-    for user_role in user_roles:
-        role = user_role.role
-        if role and role.is_active and not role.deleted_at:
-            if isinstance(role.permissions, list):
-                all_permissions.update(role.permissions)
-            elif isinstance(role.permissions, dict):
-                all_permissions.update(role.permissions.keys())
+    Users already in the permission cache are served from it; the rest are
+    loaded together and cached.
     
-    # Apply inheritance rules
-    inherited = get_inherited_permissions(list(all_permissions))
+    Args:
+        user_ids: UUIDs of the users
+        db: Database session
+        
+    Returns:
+        Dictionary mapping each user id (as a string) to its permission set
+    """
+    now = time.monotonic()
+    result: Dict[str, FrozenSet[str]] = {}
+    missing = {}
+    for user_id in user_ids:
+        key = str(user_id)
+        cached = _permission_cache.get(key)
+        if (
+            cached is not None
+            and cached[0] == _roles_epoch
+            and now - cached[1] < PERMISSION_CACHE_TTL
+        ):
+            result[key] = cached[2]
+        else:
+            missing[key] = user_id
     
-    return inherited
+    if missing:
+        roles_by_user: Dict[str, List[Tuple[str, Any]]] = {key: [] for key in missing}
+        rows = db.execute(
+            _user_roles_query().where(UserRole.user_id.in_(list(missing.values())))
+        ).all()
+        for user_id, role_name, perms in rows:
+            roles_by_user.setdefault(str(user_id), []).append((role_name, perms))
+        
+        for key, roles in roles_by_user.items():
+            permissions = _resolve_permissions(roles)
+            _cache_permissions(key, now, permissions)
+            result[key] = permissions
+    
+    return result
 
 
 async def has_permission(
@@ -109,7 +224,7 @@ async def has_any_permission(
         True if user has any of the permissions
     """
     user_permissions = await get_user_permissions(user_id, db)
-    return any(perm in user_permissions for perm in permissions)
+    return not user_permissions.isdisjoint(permissions)
 
 
 async def has_all_permissions(
@@ -129,7 +244,7 @@ async def has_all_permissions(
         True if user has all of the permissions
     """
     user_permissions = await get_user_permissions(user_id, db)
-    return all(perm in user_permissions for perm in permissions)
+    return user_permissions.issuperset(permissions)
 
 
 # ============================================================================
@@ -169,6 +284,18 @@ async def check_resource_permission(
 # AUDIT LOGGING FOR PERMISSION CHECKS
 # ============================================================================
 
+# Permissions whose checks are always audited, even when allowed
+AUDITED_PERMISSIONS = frozenset({
+    Permission.USER_MANAGE_ROLES,
+    Permission.USER_MANAGE_PERMISSIONS,
+    Permission.ROLE_CREATE,
+    Permission.ROLE_EDIT,
+    Permission.ROLE_DELETE,
+    Permission.SYSTEM_CONFIG,
+    Permission.AUDIT_LOG_EXPORT,
+})
+
+
 async def log_permission_check(
     user_id: str,
     permission: str,
@@ -176,11 +303,15 @@ async def log_permission_check(
     resource: Optional[str] = None,
     action: Optional[str] = None,
     details: Optional[dict] = None,
-    db: Optional[Session] = None
+    db: Optional[Session] = None,
+    force_sync: bool = False,
 ) -> None:
     """
     Log permission check for audit trail (especially failed attempts).
     
+    Entries are queued and written in batches by the background audit
+    writer unless force_sync is set.
+    
     Args:
         user_id: UUID of the user being checked
         permission: Permission being checked
@@ -189,52 +320,58 @@ async def log_permission_check(
         action: Action name (optional)
         details: Additional details dict (optional)
         db: Database session
+        force_sync: Write the entry in this session before returning
     """
     if db is None:
         return
     
     # Only log failed attempts and sensitive operations
-    if not allowed or permission in [
-        Permission.USER_MANAGE_ROLES,
-        Permission.USER_MANAGE_PERMISSIONS,
-        Permission.ROLE_CREATE,
-        Permission.ROLE_EDIT,
-        Permission.ROLE_DELETE,
-        Permission.SYSTEM_CONFIG,
-        Permission.AUDIT_LOG_EXPORT,
-    ]:
-        try:
-            # Verify user exists before creating audit log entry
-            user_exists = db.query(User).filter(User.id == user_id).first()
-            if not user_exists:
-                return
-            
-            audit_entry = AuditLog(
-                user_id=user_id,
-                action="permission_check",
-                entity_type="permission",
-                entity_id=permission,
-                old_values={},
-                new_values={
-                    "permission": permission,
-                    "resource": resource,
-                    "action": action,
-                    "allowed": allowed,
-                    **(details or {}),
-                },
-            )
-            db.add(audit_entry)
-            db.commit()
-        except Exception:
-            # Don't let audit logging failures break the app
-            db.rollback()
-            pass
+    if allowed and permission not in AUDITED_PERMISSIONS:
+        return
+    
+    entry = {
+        "user_id": user_id,
+        "action": "permission_check",
+        "entity_type": "permission",
+        "entity_id": permission,
+        "old_values": {},
+        "new_values": {
+            "permission": permission,
+            "resource": resource,
+            "action": action,
+            "allowed": allowed,
+            **(details or {}),
+        },
+    }
+    
+    if not force_sync:
+        # Entries for unknown users are rejected by the foreign key and
+        # dropped by the writer
+        audit_queue.put(entry)
+        return
+    
+    try:
+        # Verify user exists before creating audit log entry
+        user_exists = db.query(User.id).filter(User.id == user_id).scalar()
+        if user_exists is None:
+            return
+        
+        db.add(AuditLog(**entry))
+        db.commit()
+    except Exception:
+        # Don't let audit logging failures break the app
+        db.rollback()
 
 
 # ============================================================================
 # FASTAPI DEPENDENCIES FOR PERMISSION CHECKING
 # ============================================================================
 
+# The factories below are memoized so each distinct requirement maps to a
+# single dependency callable, which FastAPI can reuse instead of
+# re-inspecting a fresh closure.
+
+@lru_cache(maxsize=None)
 def require_permission(resource: str, action: str):
     """
     FastAPI dependency to require a specific resource-action permission.
@@ -251,6 +388,14 @@ def require_permission(resource: str, action: str):
     Returns:
         Dependency function that checks permission
     """
+    # Convert resource and action to permission string once per requirement;
+    # an unknown pair still surfaces as a 500 when the route is called
+    try:
+        permission = get_permission_for_resource_action(resource, action)
+        config_error = None
+    except ValueError as e:
+        permission = None
+        config_error = f"Configuration error: {str(e)}"
     
     async def check_permission(
         user: TokenData = Depends(_get_current_user()),
@@ -258,13 +403,10 @@ def require_permission(resource: str, action: str):
     ) -> TokenData:
         """Check that user has the required permission."""
         
-        # Convert resource and action to permission string
-        try:
-            permission = get_permission_for_resource_action(resource, action)
-        except ValueError as e:
+        if permission is None:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Configuration error: {str(e)}",
+                detail=config_error,
             )
         
         # Check permission
@@ -291,6 +433,7 @@ def require_permission(resource: str, action: str):
     return check_permission
 
 
+@lru_cache(maxsize=None)
 def require_any_permission(*permissions: str):
     """
     FastAPI dependency to require any one of the specified permissions.
@@ -308,6 +451,9 @@ def require_any_permission(*permissions: str):
     Returns:
         Dependency function that checks if user has any permission
     """
+    # Resolved once per distinct requirement rather than on every request
+    required = frozenset(permissions)
+    permission_label = "|".join(permissions)
     
     async def check_permissions(
         user: TokenData = Depends(_get_current_user()),
@@ -315,12 +461,13 @@ def require_any_permission(*permissions: str):
     ) -> TokenData:
         """Check that user has at least one of the required permissions."""
         
-        has_perm = await has_any_permission(user.sub, list(permissions), db)
+        user_permissions = await get_user_permissions(user.sub, db)
+        has_perm = not required.isdisjoint(user_permissions)
         
         if not has_perm:
             await log_permission_check(
                 user_id=user.sub,
-                permission="|".join(permissions),
+                permission=permission_label,
                 allowed=False,
                 db=db,
             )
@@ -332,7 +479,7 @@ def require_any_permission(*permissions: str):
         
         await log_permission_check(
             user_id=user.sub,
-            permission="|".join(permissions),
+            permission=permission_label,
             allowed=True,
             db=db,
         )
@@ -342,6 +489,7 @@ def require_any_permission(*permissions: str):
     return check_permissions
 
 
+@lru_cache(maxsize=None)
 def require_all_permissions(*permissions: str):
     """
     FastAPI dependency to require all of the specified permissions.
@@ -359,6 +507,9 @@ def require_all_permissions(*permissions: str):
     Returns:
         Dependency function that checks if user has all permissions
     """
+    # Resolved once per distinct requirement rather than on every request
+    required = frozenset(permissions)
+    permission_label = "&".join(permissions)
     
     async def check_permissions(
         user: TokenData = Depends(_get_current_user()),
@@ -366,12 +517,13 @@ def require_all_permissions(*permissions: str):
     ) -> TokenData:
         """Check that user has all required permissions."""
         
-        has_perm = await has_all_permissions(user.sub, list(permissions), db)
+        user_permissions = await get_user_permissions(user.sub, db)
+        has_perm = required.issubset(user_permissions)
         
         if not has_perm:
             await log_permission_check(
                 user_id=user.sub,
-                permission="&".join(permissions),
+                permission=permission_label,
                 allowed=False,
                 db=db,
             )
@@ -383,7 +535,7 @@ def require_all_permissions(*permissions: str):
         
         await log_permission_check(
             user_id=user.sub,
-            permission="&".join(permissions),
+            permission=permission_label,
             allowed=True,
             db=db,
         )
@@ -409,7 +561,7 @@ async def is_admin(user: TokenData, db: Session) -> bool:
         True if user is admin
     """
     # Check if user has admin role in roles list
-    if "admin" in (user.roles or []):
+    if "admin" in user.roles_set:
         return True
     
     # Fallback: check in database
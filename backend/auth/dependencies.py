@@ -23,6 +23,11 @@ security = HTTPBearer(
     auto_error=True
 )
 
+# Roles accepted by the predefined role checkers
+_ADMIN_ROLES = frozenset({"admin"})
+_STAFF_MANAGER_ROLES = frozenset({"admin", "staff_manager"})
+_REVIEWER_ROLES = frozenset({"admin", "reviewer"})
+
 # Development mode - bypass authentication
 ENVIRONMENT = os.getenv("ENVIRONMENT", "production").lower()
 IS_DEVELOPMENT = ENVIRONMENT == "development"
@@ -106,8 +111,10 @@ async def get_user_with_role(required_roles: list):
     Returns:
         Async function that validates user has required role
     """
+    required = frozenset(required_roles)
+    
     async def check_role(user: TokenData = Depends(get_current_user)) -> TokenData:
-        if not any(role in user.roles for role in required_roles):
+        if user.roles_set.isdisjoint(required):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Insufficient permissions. Required roles: {required_roles}"
@@ -120,7 +127,7 @@ async def get_user_with_role(required_roles: list):
 # Predefined role checkers
 async def require_admin(user: TokenData = Depends(get_current_user)) -> TokenData:
     """Dependency to require admin role."""
-    if "admin" not in user.roles:
+    if user.roles_set.isdisjoint(_ADMIN_ROLES):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin role required"
@@ -130,8 +137,7 @@ async def require_admin(user: TokenData = Depends(get_current_user)) -> TokenDat
 
 async def require_staff_manager(user: TokenData = Depends(get_current_user)) -> TokenData:
     """Dependency to require staff manager role."""
-    required_roles = ["admin", "staff_manager"]
-    if not any(role in user.roles for role in required_roles):
+    if user.roles_set.isdisjoint(_STAFF_MANAGER_ROLES):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Staff manager or admin role required"
@@ -141,8 +147,7 @@ async def require_staff_manager(user: TokenData = Depends(get_current_user)) ->
 
 async def require_reviewer(user: TokenData = Depends(get_current_user)) -> TokenData:
     """Dependency to require reviewer role."""
-    required_roles = ["admin", "reviewer"]
-    if not any(role in user.roles for role in required_roles):
+    if user.roles_set.isdisjoint(_REVIEWER_ROLES):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Reviewer or admin role required"
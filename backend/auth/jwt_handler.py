@@ -1,11 +1,13 @@
 """JWT token generation, validation, and refresh logic."""
 
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple, FrozenSet
+import time
 import jwt
 from jwt import PyJWTError
 
-from backend.auth.keys import PRIVATE_KEY, PUBLIC_KEY
+from backend.auth.keys import get_signing_key, get_verifying_key
 
 
 # Token configuration (in seconds)
@@ -15,23 +17,32 @@ ALGORITHM = "RS256"
 TOKEN_ISSUER = "transportation-forms-api"
 TOKEN_AUDIENCE = "transportation-forms-web"
 
+# Validated tokens are remembered until they expire, so repeat requests
+# with the same bearer token skip signature verification
+TOKEN_CACHE_MAX_SIZE = 10_000
 
+
+@dataclass(slots=True, frozen=True)
 class TokenData:
     """Represents decoded JWT token data."""
     
-    def __init__(
-        self,
-        sub: str,
-        email: str,
-        name: str,
-        roles: list,
-        token_type: str = "access"
-    ):
-        self.sub = sub  # Subject (user ID)
-        self.email = email
-        self.name = name
-        self.roles = roles
-        self.token_type = token_type
+    sub: str  # Subject (user ID)
+    email: str
+    name: str
+    roles: Tuple[str, ...]
+    token_type: str = "access"
+    roles_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Instances are shared across requests via _token_cache, so keep
+        # roles immutable; roles_set is for O(1) role membership checks
+        roles = tuple(self.roles or ())
+        object.__setattr__(self, "roles", roles)
+        object.__setattr__(self, "roles_set", frozenset(roles))
+
+
+# (token, token_type) -> (exp timestamp, decoded token data)
+_token_cache: Dict[Tuple[str, str], Tuple[float, TokenData]] = {}
 
 
 class JWTHandler:
@@ -76,7 +87,7 @@ class JWTHandler:
             "type": "access"
         }
         
-        token = jwt.encode(payload, PRIVATE_KEY, algorithm=ALGORITHM)
+        token = jwt.encode(payload, get_signing_key(), algorithm=ALGORITHM)
         return token
     
     @staticmethod
@@ -109,7 +120,7 @@ class JWTHandler:
             "type": "refresh"
         }
         
-        token = jwt.encode(payload, PRIVATE_KEY, algorithm=ALGORITHM)
+        token = jwt.encode(payload, get_signing_key(), algorithm=ALGORITHM)
         return token
     
     @staticmethod
@@ -127,10 +138,19 @@ class JWTHandler:
         Raises:
             ValueError: If token is invalid or expired
         """
+        key = (token, token_type)
+        cached = _token_cache.get(key)
+        if cached is not None:
+            exp, token_data = cached
+            if time.time() < exp:
+                return token_data
+            # Expired - drop it and let decode raise the usual error
+            _token_cache.pop(key, None)
+        
         try:
             payload = jwt.decode(
                 token,
-                PUBLIC_KEY,
+                get_verifying_key(),
                 algorithms=[ALGORITHM],
                 audience=TOKEN_AUDIENCE,
                 issuer=TOKEN_ISSUER
@@ -142,22 +162,30 @@ class JWTHandler:
             
             # For refresh tokens, only sub is required
             if token_type == "refresh":
-                return TokenData(
+                token_data = TokenData(
                     sub=payload.get("sub"),
                     email="",
                     name="",
                     roles=[],
                     token_type=token_type
                 )
+            else:
+                # For access tokens, decode all claims
+                token_data = TokenData(
+                    sub=payload.get("sub"),
+                    email=payload.get("email"),
+                    name=payload.get("name"),
+                    roles=payload.get("roles", []),
+                    token_type=token_type
+                )
             
-            # For access tokens, decode all claims
-            return TokenData(
-                sub=payload.get("sub"),
-                email=payload.get("email"),
-                name=payload.get("name"),
-                roles=payload.get("roles", []),
-                token_type=token_type
-            )
+            exp = payload.get("exp")
+            if exp is not None:
+                if len(_token_cache) >= TOKEN_CACHE_MAX_SIZE:
+                    _token_cache.clear()
+                _token_cache[key] = (exp, token_data)
+            
+            return token_data
             
         except jwt.ExpiredSignatureError:
             raise ValueError("Token has expired")
@@ -212,7 +240,7 @@ class JWTHandler:
             # Decode without verifying expiration to get expiry timestamp
             payload = jwt.decode(
                 token,
-                PUBLIC_KEY,
+                get_verifying_key(),
                 algorithms=[ALGORITHM],
                 audience=TOKEN_AUDIENCE,
                 issuer=TOKEN_ISSUER,
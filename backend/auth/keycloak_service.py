@@ -1,17 +1,51 @@
 """KeyCloak OIDC authentication service."""
 
+import asyncio
+import hashlib
+import json
 import logging
-import requests
-from typing import Optional, Dict, Any
-from urllib.parse import urlencode
-from keycloak import KeycloakOpenID, KeycloakAuthenticationError, KeycloakConnectionError
-from keycloak.exceptions import KeycloakGetError
+import os
+import threading
+import time
+import httpx
+import jwt
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Optional, Dict, Any, FrozenSet, Tuple
+from urllib.parse import quote, urlencode
+from keycloak import KeycloakOpenID
+from keycloak.exceptions import KeycloakError
 
 from backend.config import settings
+from backend.http_client import http_client, async_http_client
 from backend.auth.jwt_handler import jwt_handler
 
 logger = logging.getLogger(__name__)
 
+# How long the OpenID discovery document is reused before being re-fetched
+WELL_KNOWN_CACHE_TTL = 3600  # seconds
+
+# An on-disk discovery document older than this is refreshed at startup
+WELL_KNOWN_DISK_MAX_AGE = 7200  # seconds
+
+# Default location of the saved discovery document (a private, app-owned
+# directory; never a shared temp dir, since the endpoints receive tokens)
+DEFAULT_DISCOVERY_CACHE_FILE = os.path.join(
+    os.path.expanduser("~"), ".cache", "transportation-forms", "kc_oidc.json"
+)
+
+# Introspection results are reused for at most this long (and never past
+# the token's exp), so a revoked token may read as active for up to this long
+INTROSPECT_CACHE_TTL = 30  # seconds
+INTROSPECT_CACHE_MAX_SIZE = 10_000
+
+# Background workers for advisory KeyCloak logout calls
+LOGOUT_MAX_WORKERS = 4
+
+# Shared read-only defaults for missing claims in extract_roles
+_EMPTY_CLAIM = MappingProxyType({})
+_EMPTY_ROLES: FrozenSet[str] = frozenset()
+
 
 class KeyCloakService:
     """Service for KeyCloak OIDC authentication.
@@ -19,6 +53,9 @@ class KeyCloakService:
     Note: BC Gov Keycloak uses a non-standard base path (/auth) which python-keycloak
     v7.x doesn't handle properly. We work around this by using direct HTTP requests
     for URL construction while still using the library for token operations.
+    Direct requests go through the shared pooled client in backend.http_client;
+    the hot code exchange and refresh calls use it too so they reuse warm
+    connections instead of the library's own session.
     """
     
     def __init__(self):
@@ -38,8 +75,29 @@ class KeyCloakService:
                 self.base_url = f"{self.base_url}/auth"
             self.realm_url = f"{self.base_url}/realms/{settings.KEYCLOAK_REALM}"
             
+            # Client roles live under resource_access.[client_id]
+            self._client_key = settings.KEYCLOAK_CLIENT_ID
+            
             # Cache the well-known configuration
             self._well_known_config = None
+            self._well_known_expiry = 0.0
+            self._auth_url_template = None
+            self._discovery_cache_file = (
+                settings.KEYCLOAK_DISCOVERY_CACHE_FILE
+                or DEFAULT_DISCOVERY_CACHE_FILE
+            )
+            
+            # In-flight refreshes, keyed by a hash of the refresh token
+            self._refresh_lock = threading.Lock()
+            self._refresh_inflight: Dict[str, Future] = {}
+            self._a_refresh_inflight: Dict[str, asyncio.Future] = {}
+            
+            # Background logout workers, started on first logout
+            self._logout_lock = threading.Lock()
+            self._logout_executor: Optional[ThreadPoolExecutor] = None
+            
+            # Recent introspection results: token hash -> (expires_at, result)
+            self._introspect_cache: Dict[bytes, Tuple[float, Dict[str, Any]]] = {}
             
             logger.info(f"KeyCloak client initialized for realm: {settings.KEYCLOAK_REALM}")
             logger.info(f"Realm URL: {self.realm_url}")
@@ -47,14 +105,180 @@ class KeyCloakService:
             logger.error(f"Failed to initialize KeyCloak client: {str(e)}")
             raise
     
+    def warm_start(self) -> None:
+        """
+        Seed the discovery cache so the first login doesn't wait on KeyCloak.
+        
+        Called from the application startup hook (not on import). Loads the
+        last document saved to disk; if there is none or it is older than
+        WELL_KNOWN_DISK_MAX_AGE, fetches a fresh one on a daemon thread so
+        startup never blocks on KeyCloak.
+        """
+        age = self._load_well_known_from_disk()
+        if age is None or age > WELL_KNOWN_DISK_MAX_AGE:
+            threading.Thread(
+                target=self._prefetch_well_known_config,
+                name="kc-discovery",
+                daemon=True,
+            ).start()
+    
+    def _prefetch_well_known_config(self) -> None:
+        """Fetch the discovery document in the background, ignoring failures."""
+        try:
+            self._get_well_known_config()
+        except Exception as e:
+            logger.warning(f"Failed to prefetch OpenID configuration: {str(e)}")
+    
+    def _load_well_known_from_disk(self) -> Optional[float]:
+        """
+        Load the saved discovery document for this realm.
+        
+        Returns:
+            Age of the saved document in seconds, or None if none was loaded
+        """
+        try:
+            with open(self._discovery_cache_file) as f:
+                file_stat = os.fstat(f.fileno())
+                # Only trust a file this process's user wrote and others can't modify
+                if file_stat.st_uid != os.getuid() or file_stat.st_mode & 0o022:
+                    logger.warning(
+                        f"Ignoring {self._discovery_cache_file}: unsafe owner or permissions"
+                    )
+                    return None
+                saved = json.load(f)
+            if saved.get('realm_url') != self.realm_url:
+                return None
+            age = max(0.0, time.time() - saved['fetched_at'])
+            config = saved['config']
+            if not self._is_realm_config(config):
+                logger.warning(
+                    f"Ignoring {self._discovery_cache_file}: endpoints outside {self.realm_url}"
+                )
+                return None
+            auth_endpoint = config['authorization_endpoint']
+            self._auth_url_template = self._build_auth_url_template(auth_endpoint)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None
+        
+        self._well_known_config = config
+        self._well_known_expiry = time.monotonic() + max(0.0, WELL_KNOWN_CACHE_TTL - age)
+        logger.info(f"Loaded OpenID configuration from {self._discovery_cache_file}")
+        return age
+    
+    def _is_realm_config(self, config: Dict[str, Any]) -> bool:
+        """Check that the issuer and every endpoint belong to this realm."""
+        if config.get('issuer') != self.realm_url:
+            return False
+        realm_prefix = f"{self.realm_url}/"
+        for name, value in config.items():
+            if name.endswith('_endpoint') or name == 'jwks_uri':
+                if not isinstance(value, str) or not value.startswith(realm_prefix):
+                    return False
+        return True
+    
+    def _save_well_known_to_disk(self, config: Dict[str, Any]) -> None:
+        """Persist the discovery document for the next process start (best effort)."""
+        saved = {'realm_url': self.realm_url, 'fetched_at': time.time(), 'config': config}
+        tmp_path = f"{self._discovery_cache_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self._discovery_cache_file), mode=0o700, exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(saved, f)
+            os.replace(tmp_path, self._discovery_cache_file)
+        except OSError as e:
+            logger.warning(f"Failed to save OpenID configuration: {str(e)}")
+    
+    def _well_known_url(self) -> str:
+        """URL of the realm's OpenID discovery document."""
+        return f"{self.realm_url}/.well-known/openid-configuration"
+    
+    def _cached_well_known_config(self) -> Optional[Dict[str, Any]]:
+        """Return the cached discovery document if it hasn't expired."""
+        if self._well_known_config is not None and time.monotonic() < self._well_known_expiry:
+            return self._well_known_config
+        return None
+    
+    def _store_well_known_config(
+        self,
+        config: Dict[str, Any],
+        persist: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Cache a freshly fetched discovery document.
+        
+        Args:
+            config: Discovery document
+            persist: Also save it to disk; async callers pass False and
+                save from a worker thread instead
+        """
+        self._well_known_config = config
+        self._well_known_expiry = time.monotonic() + WELL_KNOWN_CACHE_TTL
+        self._auth_url_template = self._build_auth_url_template(config['authorization_endpoint'])
+        if persist:
+            self._save_well_known_to_disk(config)
+        return config
+    
+    def _stale_well_known_config(self) -> Dict[str, Any]:
+        """Keep serving the previous document if KeyCloak is briefly unreachable."""
+        logger.warning("Failed to refresh OpenID configuration, using cached copy")
+        self._well_known_expiry = time.monotonic() + 60
+        return self._well_known_config
+    
     def _get_well_known_config(self) -> Dict[str, Any]:
-        """Get OpenID well-known configuration (cached)."""
-        if self._well_known_config is None:
-            url = f"{self.realm_url}/.well-known/openid-configuration"
-            response = requests.get(url, timeout=10, verify=True)
+        """Get OpenID well-known configuration (cached for WELL_KNOWN_CACHE_TTL)."""
+        config = self._cached_well_known_config()
+        if config is not None:
+            return config
+        try:
+            response = http_client.get(self._well_known_url())
             response.raise_for_status()
-            self._well_known_config = response.json()
-        return self._well_known_config
+        except httpx.HTTPError:
+            if self._well_known_config is None:
+                raise
+            return self._stale_well_known_config()
+        return self._store_well_known_config(response.json())
+    
+    @staticmethod
+    def _build_auth_url_template(auth_endpoint: str) -> str:
+        """
+        Build the authorization URL up to the state value.
+        
+        Only state varies between logins, so the constant query string is
+        encoded once per discovery fetch and the state is appended per call.
+        """
+        params = {
+            'client_id': settings.KEYCLOAK_CLIENT_ID,
+            'redirect_uri': settings.KEYCLOAK_REDIRECT_URI,
+            'response_type': 'code',
+            'scope': 'openid email profile',
+        }
+        return f"{auth_endpoint}?{urlencode(params)}&state="
+    
+    def _build_auth_url(self, state: str) -> str:
+        """Build the authorization redirect URL for a state value."""
+        return self._auth_url_template + quote(state, safe='')
+    
+    @staticmethod
+    def _token_request_data(code: str) -> Dict[str, str]:
+        """Form body for the authorization code token request."""
+        return {
+            'grant_type': 'authorization_code',
+            'code': code,
+            'redirect_uri': settings.KEYCLOAK_REDIRECT_URI,
+            'client_id': settings.KEYCLOAK_CLIENT_ID,
+            'client_secret': settings.KEYCLOAK_CLIENT_SECRET
+        }
+    
+    @staticmethod
+    def _refresh_request_data(refresh_token: str) -> Dict[str, str]:
+        """Form body for the refresh token grant."""
+        return {
+            'grant_type': 'refresh_token',
+            'refresh_token': refresh_token,
+            'client_id': settings.KEYCLOAK_CLIENT_ID,
+            'client_secret': settings.KEYCLOAK_CLIENT_SECRET
+        }
     
     def get_auth_url(self, state: str) -> str:
         """
@@ -68,18 +292,9 @@ class KeyCloakService:
         """
         try:
             # Use well-known config to get correct authorization endpoint
-            config = self._get_well_known_config()
-            auth_endpoint = config['authorization_endpoint']
-            
-            params = {
-                'client_id': settings.KEYCLOAK_CLIENT_ID,
-                'redirect_uri': settings.KEYCLOAK_REDIRECT_URI,
-                'response_type': 'code',
-                'scope': 'openid email profile',
-                'state': state
-            }
+            self._get_well_known_config()
             
-            auth_url = f"{auth_endpoint}?{urlencode(params)}"
+            auth_url = self._build_auth_url(state)
             logger.debug(f"Generated auth URL: {auth_url[:100]}...")
             return auth_url
         except Exception as e:
@@ -104,28 +319,17 @@ class KeyCloakService:
             config = self._get_well_known_config()
             token_endpoint = config['token_endpoint']
             
-            # Prepare token request
-            data = {
-                'grant_type': 'authorization_code',
-                'code': code,
-                'redirect_uri': settings.KEYCLOAK_REDIRECT_URI,
-                'client_id': settings.KEYCLOAK_CLIENT_ID,
-                'client_secret': settings.KEYCLOAK_CLIENT_SECRET
-            }
-            
-            response = requests.post(
+            response = http_client.post(
                 token_endpoint,
-                data=data,
+                data=self._token_request_data(code),
                 headers={'Content-Type': 'application/x-www-form-urlencoded'},
-                timeout=10,
-                verify=True
             )
             response.raise_for_status()
             token_response = response.json()
             
             logger.info("Successfully exchanged authorization code for tokens")
             return token_response
-        except requests.exceptions.HTTPError as e:
+        except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error during token exchange: {str(e)}")
             if e.response is not None:
                 logger.error(f"Response: {e.response.text[:200]}")
@@ -152,21 +356,19 @@ class KeyCloakService:
             config = self._get_well_known_config()
             userinfo_endpoint = config['userinfo_endpoint']
             
-            response = requests.get(
+            response = http_client.get(
                 userinfo_endpoint,
                 headers={'Authorization': f'Bearer {access_token}'},
-                timeout=10,
-                verify=True
             )
             response.raise_for_status()
             userinfo = response.json()
             
             logger.info(f"Retrieved user info for: {userinfo.get('email', 'unknown')}")
             return userinfo
-        except requests.exceptions.HTTPError as e:
+        except httpx.HTTPStatusError as e:
             logger.error(f"Failed to get user info: {str(e)}")
             raise ValueError(f"Failed to retrieve user information: {str(e)}")
-        except Exception as e:
+        except (httpx.HTTPError, KeyError, ValueError) as e:
             logger.error(f"User info retrieval error: {str(e)}")
             raise ValueError(f"User info retrieval failed: {str(e)}")
     
@@ -183,17 +385,46 @@ class KeyCloakService:
         Raises:
             ValueError: If introspection fails
         """
+        key = hashlib.sha256(token.encode()).digest()
+        cached = self._cached_introspection(key)
+        if cached is not None:
+            return cached
         try:
             introspection = self.keycloak_openid.introspect(token)
-            return introspection
-        except Exception as e:
+        except KeycloakError as e:
             logger.error(f"Token introspection failed: {str(e)}")
             raise ValueError(f"Token introspection failed: {str(e)}")
+        return self._store_introspection(key, introspection)
+    
+    def _cached_introspection(self, key: bytes) -> Optional[Dict[str, Any]]:
+        """Return a cached introspection result if it hasn't expired."""
+        cached = self._introspect_cache.get(key)
+        if cached is not None:
+            expires_at, introspection = cached
+            if time.time() < expires_at:
+                return introspection
+            self._introspect_cache.pop(key, None)
+        return None
+    
+    def _store_introspection(self, key: bytes, introspection: Dict[str, Any]) -> Dict[str, Any]:
+        """Cache an introspection result until min(now + TTL, token exp)."""
+        expires_at = time.time() + INTROSPECT_CACHE_TTL
+        exp = introspection.get('exp')
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, exp)
+        if len(self._introspect_cache) >= INTROSPECT_CACHE_MAX_SIZE:
+            self._introspect_cache.clear()
+        self._introspect_cache[key] = (expires_at, introspection)
+        return introspection
     
     def refresh_token(self, refresh_token: str) -> Dict[str, Any]:
         """
         Refresh access token using refresh token.
         
+        Concurrent calls with the same refresh token share one request to
+        KeyCloak; with refresh token rotation a second request would be
+        rejected as a reused token.
+        
         Args:
             refresh_token: KeyCloak refresh token
             
@@ -203,11 +434,47 @@ class KeyCloakService:
         Raises:
             ValueError: If token refresh fails
         """
+        key = hashlib.sha256(refresh_token.encode()).hexdigest()
+        with self._refresh_lock:
+            future = self._refresh_inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._refresh_inflight[key] = future
+        
+        if not is_owner:
+            return future.result()
+        
         try:
-            token_response = self.keycloak_openid.refresh_token(refresh_token)
+            token_response = self._refresh_token(refresh_token)
+            future.set_result(token_response)
+            return token_response
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._refresh_lock:
+                self._refresh_inflight.pop(key, None)
+    
+    def _refresh_token(self, refresh_token: str) -> Dict[str, Any]:
+        """Send the refresh request to KeyCloak."""
+        try:
+            config = self._get_well_known_config()
+            response = http_client.post(
+                config['token_endpoint'],
+                data=self._refresh_request_data(refresh_token),
+                headers={'Content-Type': 'application/x-www-form-urlencoded'},
+            )
+            response.raise_for_status()
+            token_response = response.json()
             logger.info("Successfully refreshed access token")
             return token_response
-        except KeycloakAuthenticationError as e:
+        except httpx.HTTPStatusError as e:
+            # KeyCloak rejects expired/revoked refresh tokens with 400/401;
+            # anything else (e.g. a 5xx outage) says nothing about the token
+            if e.response.status_code not in (400, 401):
+                logger.error(f"Token refresh failed: {str(e)}")
+                raise ValueError(f"Token refresh failed: {str(e)}")
             logger.error(f"Token refresh authentication error: {str(e)}")
             raise ValueError(f"Invalid refresh token: {str(e)}")
         except Exception as e:
@@ -218,20 +485,43 @@ class KeyCloakService:
         """
         Logout user by invalidating refresh token.
         
+        The KeyCloak call is advisory (failures are ignored), so it runs on a
+        background thread and the caller doesn't wait on the round trip.
+        
         Args:
             refresh_token: KeyCloak refresh token to invalidate
             
         Returns:
-            True if logout successful
+            True once the logout has been submitted
         """
+        with self._logout_lock:
+            if self._logout_executor is None:
+                self._logout_executor = ThreadPoolExecutor(
+                    max_workers=LOGOUT_MAX_WORKERS,
+                    thread_name_prefix="kc-logout",
+                )
+            self._logout_executor.submit(self._logout, refresh_token)
+        return True
+    
+    def shutdown(self) -> None:
+        """
+        Wait for submitted background logouts to finish (application shutdown).
+        
+        A later logout starts a fresh executor, so the service stays usable
+        if the application is started again in the same process.
+        """
+        with self._logout_lock:
+            executor, self._logout_executor = self._logout_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=False)
+    
+    def _logout(self, refresh_token: str) -> None:
+        """Send the logout request to KeyCloak."""
         try:
             self.keycloak_openid.logout(refresh_token)
             logger.info("Successfully logged out user")
-            return True
         except Exception as e:
             logger.warning(f"Logout failed (token may already be invalid): {str(e)}")
-            # Return True anyway since the goal is to clear the session
-            return True
     
     def decode_token(self, token: str) -> Dict[str, Any]:
         """
@@ -245,14 +535,13 @@ class KeyCloakService:
         """
         try:
             # KeyCloak tokens are standard JWTs, decode without verification for claims
-            import jwt
             decoded = jwt.decode(token, options={"verify_signature": False})
             return decoded
-        except Exception as e:
+        except jwt.PyJWTError as e:
             logger.error(f"Token decode failed: {str(e)}")
             raise ValueError(f"Invalid token format: {str(e)}")
     
-    def extract_roles(self, keycloak_token_payload: Dict[str, Any]) -> list:
+    def extract_roles(self, keycloak_token_payload: Dict[str, Any]) -> FrozenSet[str]:
         """
         Extract roles from KeyCloak token payload.
         
@@ -260,19 +549,159 @@ class KeyCloakService:
             keycloak_token_payload: Decoded KeyCloak token
             
         Returns:
-            List of role names from client roles
+            Set of role names from client roles
         """
         try:
             # KeyCloak client roles are in resource_access.[client_id].roles
-            resource_access = keycloak_token_payload.get("resource_access", {})
-            client_roles = resource_access.get(settings.KEYCLOAK_CLIENT_ID, {})
-            roles = client_roles.get("roles", [])
+            resource_access = keycloak_token_payload.get("resource_access", _EMPTY_CLAIM)
+            client_roles = resource_access.get(self._client_key, _EMPTY_CLAIM)
+            roles = client_roles.get("roles")
+            roles = frozenset(roles) if roles else _EMPTY_ROLES
             
-            logger.info(f"Extracted roles: {roles}")
+            logger.info(f"Extracted roles: {sorted(roles)}")
             return roles
         except Exception as e:
-            logger.warning(f"Failed to extract roles, defaulting to empty list: {str(e)}")
-            return []
+            logger.warning(f"Failed to extract roles, defaulting to empty set: {str(e)}")
+            return _EMPTY_ROLES
+    
+    # =====================================================================
+    # ASYNC VARIANTS
+    # =====================================================================
+    # Same behaviour as the methods above, for use from async route
+    # handlers so KeyCloak round trips don't block the event loop.
+    
+    async def _a_get_well_known_config(self) -> Dict[str, Any]:
+        """Get OpenID well-known configuration without blocking (shared cache)."""
+        config = self._cached_well_known_config()
+        if config is not None:
+            return config
+        try:
+            response = await async_http_client.get(self._well_known_url())
+            response.raise_for_status()
+        except httpx.HTTPError:
+            if self._well_known_config is None:
+                raise
+            return self._stale_well_known_config()
+        config = self._store_well_known_config(response.json(), persist=False)
+        # Keep the file I/O off the event loop
+        await asyncio.to_thread(self._save_well_known_to_disk, config)
+        return config
+    
+    async def a_get_auth_url(self, state: str) -> str:
+        """Async variant of get_auth_url."""
+        try:
+            await self._a_get_well_known_config()
+            return self._build_auth_url(state)
+        except Exception as e:
+            logger.error(f"Failed to generate auth URL: {str(e)}")
+            raise ValueError(f"Failed to generate authorization URL: {str(e)}")
+    
+    async def a_exchange_code_for_token(self, code: str) -> Dict[str, Any]:
+        """Async variant of exchange_code_for_token."""
+        try:
+            config = await self._a_get_well_known_config()
+            response = await async_http_client.post(
+                config['token_endpoint'],
+                data=self._token_request_data(code),
+                headers={'Content-Type': 'application/x-www-form-urlencoded'},
+            )
+            response.raise_for_status()
+            token_response = response.json()
+            
+            logger.info("Successfully exchanged authorization code for tokens")
+            return token_response
+        except httpx.HTTPStatusError as e:
+            logger.error(f"HTTP error during token exchange: {str(e)}")
+            if e.response is not None:
+                logger.error(f"Response: {e.response.text[:200]}")
+            raise ValueError(f"Authentication failed: {str(e)}")
+        except Exception as e:
+            logger.error(f"Token exchange failed: {str(e)}")
+            raise ValueError(f"Token exchange failed: {str(e)}")
+    
+    async def a_get_user_info(self, access_token: str) -> Dict[str, Any]:
+        """Async variant of get_user_info."""
+        try:
+            config = await self._a_get_well_known_config()
+            response = await async_http_client.get(
+                config['userinfo_endpoint'],
+                headers={'Authorization': f'Bearer {access_token}'},
+            )
+            response.raise_for_status()
+            userinfo = response.json()
+            
+            logger.info(f"Retrieved user info for: {userinfo.get('email', 'unknown')}")
+            return userinfo
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Failed to get user info: {str(e)}")
+            raise ValueError(f"Failed to retrieve user information: {str(e)}")
+        except (httpx.HTTPError, KeyError, ValueError) as e:
+            logger.error(f"User info retrieval error: {str(e)}")
+            raise ValueError(f"User info retrieval failed: {str(e)}")
+    
+    async def a_introspect_token(self, token: str) -> Dict[str, Any]:
+        """Async variant of introspect_token (shares its cache)."""
+        key = hashlib.sha256(token.encode()).digest()
+        cached = self._cached_introspection(key)
+        if cached is not None:
+            return cached
+        try:
+            introspection = await self.keycloak_openid.a_introspect(token)
+        except KeycloakError as e:
+            logger.error(f"Token introspection failed: {str(e)}")
+            raise ValueError(f"Token introspection failed: {str(e)}")
+        return self._store_introspection(key, introspection)
+    
+    async def a_refresh_token(self, refresh_token: str) -> Dict[str, Any]:
+        """
+        Async variant of refresh_token.
+        
+        Concurrent calls with the same refresh token await one shared task.
+        """
+        key = hashlib.sha256(refresh_token.encode()).hexdigest()
+        task = self._a_refresh_inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._a_refresh_token(refresh_token))
+            self._a_refresh_inflight[key] = task
+            task.add_done_callback(lambda _: self._a_refresh_inflight.pop(key, None))
+        # Shielded so one cancelled caller doesn't cancel the others' refresh
+        return await asyncio.shield(task)
+    
+    async def _a_refresh_token(self, refresh_token: str) -> Dict[str, Any]:
+        """Send the refresh request to KeyCloak without blocking."""
+        try:
+            config = await self._a_get_well_known_config()
+            response = await async_http_client.post(
+                config['token_endpoint'],
+                data=self._refresh_request_data(refresh_token),
+                headers={'Content-Type': 'application/x-www-form-urlencoded'},
+            )
+            response.raise_for_status()
+            token_response = response.json()
+            logger.info("Successfully refreshed access token")
+            return token_response
+        except httpx.HTTPStatusError as e:
+            # KeyCloak rejects expired/revoked refresh tokens with 400/401;
+            # anything else (e.g. a 5xx outage) says nothing about the token
+            if e.response.status_code not in (400, 401):
+                logger.error(f"Token refresh failed: {str(e)}")
+                raise ValueError(f"Token refresh failed: {str(e)}")
+            logger.error(f"Token refresh authentication error: {str(e)}")
+            raise ValueError(f"Invalid refresh token: {str(e)}")
+        except Exception as e:
+            logger.error(f"Token refresh failed: {str(e)}")
+            raise ValueError(f"Token refresh failed: {str(e)}")
+    
+    async def a_logout(self, refresh_token: str) -> bool:
+        """Async variant of logout."""
+        try:
+            await self.keycloak_openid.a_logout(refresh_token)
+            logger.info("Successfully logged out user")
+            return True
+        except Exception as e:
+            logger.warning(f"Logout failed (token may already be invalid): {str(e)}")
+            # Return True anyway since the goal is to clear the session
+            return True
     
     def generate_app_tokens(
         self,
@@ -1,5 +1,6 @@
 """RSA key management for JWT token signing and verification."""
 
+import functools
 import os
 from pathlib import Path
 from cryptography.hazmat.primitives.asymmetric import rsa
@@ -82,5 +83,49 @@ def ensure_keys_exist() -> tuple:
     return private_pem, public_pem
 
 
-# Load keys on module import
-PRIVATE_KEY, PUBLIC_KEY = ensure_keys_exist()
+# Keys are loaded on first use rather than at import, so processes that
+# never sign or verify a token (migrations, seed scripts) skip the disk
+# read, possible key generation, and PEM parsing.
+
+@functools.cache
+def load_keys() -> tuple:
+    """
+    Load (or generate) the PEM key pair once per process.
+    
+    Returns:
+        tuple: (private_key_str, public_key_str)
+    """
+    return ensure_keys_exist()
+
+
+@functools.cache
+def get_signing_key():
+    """
+    Get the parsed private key for signing.
+    
+    PyJWT re-parses PEM strings on every encode, so the key object is
+    parsed once and reused.
+    """
+    return serialization.load_pem_private_key(
+        load_keys()[0].encode('utf-8'),
+        password=None,
+        backend=default_backend()
+    )
+
+
+@functools.cache
+def get_verifying_key():
+    """Get the parsed public key for verification."""
+    return serialization.load_pem_public_key(
+        load_keys()[1].encode('utf-8'),
+        backend=default_backend()
+    )
+
+
+def __getattr__(name: str):
+    """Resolve PRIVATE_KEY / PUBLIC_KEY lazily for existing importers."""
+    if name == "PRIVATE_KEY":
+        return load_keys()[0]
+    if name == "PUBLIC_KEY":
+        return load_keys()[1]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
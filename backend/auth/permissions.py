@@ -8,7 +8,7 @@ This module defines:
 """
 
 from enum import Enum
-from typing import List, Dict, Set
+from typing import List, Dict, FrozenSet, Iterable
 
 
 # ============================================================================
@@ -68,6 +68,10 @@ class Permission(str, Enum):
     SYSTEM_HEALTH = "system:health"
 
 
+# Plain string value per permission, for serialization without attribute lookups
+PERMISSION_VALUES: Dict[Permission, str] = {p: p.value for p in Permission}
+
+
 # ============================================================================
 # DEFAULT ROLES & PERMISSION MAPPINGS
 # ============================================================================
@@ -195,6 +199,13 @@ DEFAULT_ROLES: Dict[str, Dict[str, any]] = {
 }
 
 
+# Serialized permission strings per default role (as stored in roles.permissions)
+DEFAULT_ROLE_PERMISSIONS: Dict[str, List[str]] = {
+    role_name: [PERMISSION_VALUES[p] for p in role_config["permissions"]]
+    for role_name, role_config in DEFAULT_ROLES.items()
+}
+
+
 # ============================================================================
 # PERMISSION GROUPS (for easier permission management)
 # ============================================================================
@@ -239,36 +250,54 @@ PERMISSION_GROUPS: Dict[str, List[Permission]] = {
 # PERMISSION INHERITANCE RULES
 # ============================================================================
 
-def get_inherited_permissions(permissions: List[str]) -> Set[str]:
+# Direct implications: holding the key permission grants the listed ones
+PERMISSION_IMPLICATIONS: Dict[str, List[str]] = {
+    # If user has form delete, they implicitly have form edit
+    Permission.FORM_DELETE.value: [Permission.FORM_EDIT.value],
+    
+    # If user has user management role, they can read users
+    Permission.USER_MANAGE_ROLES.value: [Permission.USER_READ.value],
+    
+    # If user can manage business areas, they can read them
+    Permission.BUSINESS_AREA_MANAGE.value: [Permission.BUSINESS_AREA_READ.value],
+}
+
+
+def _implication_closure(permission: str) -> FrozenSet[str]:
+    """Walk PERMISSION_IMPLICATIONS to collect everything a permission grants."""
+    seen = {permission}
+    pending = [permission]
+    while pending:
+        for implied in PERMISSION_IMPLICATIONS.get(pending.pop(), ()):
+            if implied not in seen:
+                seen.add(implied)
+                pending.append(implied)
+    return frozenset(seen)
+
+
+# Transitive closure per permission, computed once at import
+_PERMISSION_CLOSURES: Dict[str, FrozenSet[str]] = {
+    value: _implication_closure(value) for value in PERMISSION_VALUES.values()
+}
+
+
+def get_inherited_permissions(permissions: Iterable[str]) -> FrozenSet[str]:
     """
     Apply permission inheritance rules.
     
-    Inheritance hierarchy:
-    - No inheritance by default
-    - This function can be extended to add inheritance logic
+    Inheritance hierarchy is defined in PERMISSION_IMPLICATIONS and
+    resolved ahead of time into _PERMISSION_CLOSURES.
     
     Args:
-        permissions: List of permission strings
+        permissions: Permission strings
         
     Returns:
-        Set of permissions including inherited ones
+        Frozen set of permissions including inherited ones
     """
-    result = set(permissions)
-    
-    # Example inheritance rules (can be extended):
-    # If user has form delete, they implicitly have form edit
-    if Permission.FORM_DELETE in result or "form:delete" in permissions:
-        result.add(Permission.FORM_EDIT)
-    
-    # If user has user management role, they can read users
-    if Permission.USER_MANAGE_ROLES in result or "user:manage_roles" in permissions:
-        result.add(Permission.USER_READ)
-    
-    # If user can manage business areas, they can read them
-    if Permission.BUSINESS_AREA_MANAGE in result or "business_area:manage" in permissions:
-        result.add(Permission.BUSINESS_AREA_READ)
-    
-    return result
+    permissions = frozenset(permissions)
+    return permissions.union(*(
+        _PERMISSION_CLOSURES[p] for p in permissions if p in _PERMISSION_CLOSURES
+    ))
 
 
 # ============================================================================
@@ -348,4 +377,4 @@ def get_permission_for_resource_action(resource: str, action: str) -> str:
     if action not in RESOURCE_ACTION_PERMISSIONS[resource]:
         raise ValueError(f"Unknown action '{action}' for resource '{resource}'")
     
-    return RESOURCE_ACTION_PERMISSIONS[resource][action]
+    return PERMISSION_VALUES[RESOURCE_ACTION_PERMISSIONS[resource][action]]
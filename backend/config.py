@@ -13,6 +13,8 @@ class Settings(BaseSettings):
     DB_MAX_OVERFLOW: int = 20
     DB_POOL_TIMEOUT: int = 30
     DB_POOL_RECYCLE: int = 3600
+    DB_INSERTMANYVALUES_PAGE_SIZE: int = 1000
+    DB_EXECUTEMANY_BATCH_PAGE_SIZE: int = 500
     
     # API
     API_PREFIX: str = "/api/v1"
@@ -25,6 +27,8 @@ class Settings(BaseSettings):
     KEYCLOAK_CLIENT_ID: Optional[str] = "test-client"
     KEYCLOAK_CLIENT_SECRET: Optional[str] = "test-secret"
     KEYCLOAK_REDIRECT_URI: str = "http://localhost:8000/api/v1/auth/callback"
+    # Saved OIDC discovery document; defaults to ~/.cache/transportation-forms/kc_oidc.json
+    KEYCLOAK_DISCOVERY_CACHE_FILE: Optional[str] = None
     
     # AWS S3
     AWS_ACCESS_KEY_ID: Optional[str] = None
@@ -3,6 +3,7 @@ Database configuration and session management
 """
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import QueuePool
@@ -22,6 +23,17 @@ DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
 DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
 DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
 
+# Bulk write settings: rows per multi-VALUES INSERT, and rows per batch for
+# executemany UPDATE/DELETE on psycopg2
+DB_INSERTMANYVALUES_PAGE_SIZE = int(os.getenv("DB_INSERTMANYVALUES_PAGE_SIZE", "1000"))
+DB_EXECUTEMANY_BATCH_PAGE_SIZE = int(os.getenv("DB_EXECUTEMANY_BATCH_PAGE_SIZE", "500"))
+
+# Driver-specific engine options
+engine_options = {}
+if make_url(DATABASE_URL).get_driver_name() == "psycopg2":
+    engine_options["executemany_mode"] = "values_plus_batch"
+    engine_options["executemany_batch_page_size"] = DB_EXECUTEMANY_BATCH_PAGE_SIZE
+
 # Create engine with connection pooling
 engine = create_engine(
     DATABASE_URL,
@@ -32,6 +44,8 @@ engine = create_engine(
     pool_pre_ping=True,  # Test connections before use
     pool_recycle=3600,   # Recycle connections hourly
     echo=os.getenv("SQLALCHEMY_ECHO", "false").lower() == "true",
+    insertmanyvalues_page_size=DB_INSERTMANYVALUES_PAGE_SIZE,
+    **engine_options,
 )
 
 # Session factory
@@ -0,0 +1,25 @@
+"""Shared outbound HTTP client.
+
+A single pooled client keeps TCP/TLS connections to KeyCloak alive between
+requests instead of paying a new handshake on every call.
+"""
+
+import importlib.util
+
+import httpx
+
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+HTTP_TIMEOUT = 10.0  # seconds
+
+# Multiplex requests over one connection when KeyCloak negotiates HTTP/2;
+# needs the h2 package (httpx[http2]), otherwise stays on HTTP/1.1
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+# Global HTTP client instances (closed on application shutdown); the async
+# client serves async route handlers without blocking the event loop
+http_client = httpx.Client(
+    limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT, http2=HTTP2_ENABLED
+)
+async_http_client = httpx.AsyncClient(
+    limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT, http2=HTTP2_ENABLED
+)
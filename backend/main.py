@@ -8,6 +8,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, FileResponse
 from fastapi.staticfiles import StaticFiles
 import structlog
+import asyncio
 import os
 
 # Configure logging
@@ -39,6 +40,8 @@ app.add_middleware(
 
 # Mount static files for frontend
 frontend_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "frontend")
+index_path = os.path.join(frontend_dir, "index.html")
+index_exists = os.path.exists(index_path)  # Resolved once; frontend is not in the API image
 if os.path.exists(frontend_dir):
     app.mount("/static", StaticFiles(directory=frontend_dir), name="static")
 
@@ -65,8 +68,7 @@ async def root():
 @app.get("/")
 async def serve_frontend():
     """Serve the frontend index page"""
-    index_path = os.path.join(frontend_dir, "index.html")
-    if os.path.exists(index_path):
+    if index_exists:
         return FileResponse(index_path)
     return JSONResponse(
         status_code=404,
@@ -76,11 +78,31 @@ async def serve_frontend():
 
 # Include API routes
 from backend.routes import auth, forms
+from backend.services.audit_queue import audit_queue
+from backend.http_client import http_client, async_http_client
+from backend.auth.keycloak_service import keycloak_service
 
 app.include_router(auth.router, prefix="/api/v1")
 app.include_router(forms.router, prefix="/api/v1")
 
 
+@app.on_event("startup")
+async def startup():
+    """Warm the KeyCloak discovery cache without blocking startup"""
+    keycloak_service.warm_start()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Flush queued audit log entries and close pooled connections"""
+    # Thread joins run off the event loop
+    await asyncio.to_thread(audit_queue.stop)
+    # Let pending KeyCloak logouts finish before connections close
+    await asyncio.to_thread(keycloak_service.shutdown)
+    http_client.close()
+    await async_http_client.aclose()
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -9,7 +9,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from sqlalchemy.types import TypeDecorator
 import uuid
 from datetime import datetime
@@ -76,6 +76,12 @@ class Role(Base):
     
     # Relationships
     user_roles = relationship("UserRole", back_populates="role", cascade="all, delete-orphan")
+    
+    __table_args__ = (
+        # Partial index for live, active role lookups by name
+        Index('idx_roles_alive_name', 'name',
+              postgresql_where=text('deleted_at IS NULL AND is_active')),
+    )
 
 
 # ============================================================================
@@ -155,6 +161,14 @@ class Form(Base):
         Index('idx_forms_status_public', 'status', 'is_public'),
         Index('idx_forms_category', 'category'),
         Index('idx_forms_created_by', 'created_by_id'),
+        # Partial indexes covering the soft-delete filter on read paths
+        Index('idx_forms_alive', 'id', postgresql_where=text('deleted_at IS NULL')),
+        Index('idx_forms_alive_created', created_at.desc(), id.desc(),
+              postgresql_where=text('deleted_at IS NULL')),
+        Index('idx_forms_alive_status_created', 'status', created_at.desc(),
+              postgresql_where=text('deleted_at IS NULL')),
+        Index('idx_forms_alive_category_created', 'category', created_at.desc(),
+              postgresql_where=text('deleted_at IS NULL')),
     )
 
 
@@ -259,6 +273,8 @@ class AuditLog(Base):
     __table_args__ = (
         Index('idx_audit_log_entity', 'entity_type', 'entity_id', 'created_at'),
         Index('idx_audit_log_user_date', 'user_id', 'created_at'),
+        # Latest entries of one action for a user (e.g. permission checks)
+        Index('idx_audit_log_user_action_date', 'user_id', 'action', created_at.desc()),
     )
 
 
@@ -3,7 +3,7 @@
 import logging
 import secrets
 from uuid import UUID
-from typing import Optional
+from typing import Iterable, Optional, MutableMapping
 from fastapi import APIRouter, HTTPException, status, Depends, Query, Response
 from fastapi.responses import RedirectResponse
 from pydantic import BaseModel, EmailStr
@@ -14,6 +14,7 @@ from backend.models import User, Role, UserRole
 from backend.auth.keycloak_service import keycloak_service
 from backend.auth.jwt_handler import jwt_handler
 from backend.auth.dependencies import get_current_user
+from backend.auth.authorization import invalidate_permission_cache
 from backend.auth.jwt_handler import TokenData
 
 logger = logging.getLogger(__name__)
@@ -46,19 +47,31 @@ class LogoutRequest(BaseModel):
 _auth_states = {}
 
 
-def generate_state() -> str:
-    """Generate a secure random state for CSRF protection."""
+def generate_state(store: Optional[MutableMapping[str, dict]] = None) -> str:
+    """
+    Generate a secure random state for CSRF protection.
+    
+    Args:
+        store: State store to record the state in (defaults to the module store)
+    """
+    if store is None:
+        store = _auth_states
     state = secrets.token_urlsafe(32)
-    _auth_states[state] = {"purpose": "login"}
+    store[state] = {"purpose": "login"}
     return state
 
 
-def validate_state(state: str) -> bool:
-    """Validate and consume a state token."""
-    if state in _auth_states:
-        _auth_states.pop(state)
-        return True
-    return False
+def validate_state(state: str, store: Optional[MutableMapping[str, dict]] = None) -> bool:
+    """
+    Validate and consume a state token.
+    
+    Args:
+        state: State value returned by the identity provider
+        store: State store to check (defaults to the module store)
+    """
+    if store is None:
+        store = _auth_states
+    return store.pop(state, None) is not None
 
 
 @router.get("/login")
@@ -73,7 +86,7 @@ async def login():
         state = generate_state()
         
         # Get KeyCloak authorization URL
-        auth_url = keycloak_service.get_auth_url(state=state)
+        auth_url = await keycloak_service.a_get_auth_url(state=state)
         
         logger.info("Redirecting to KeyCloak login")
         return RedirectResponse(url=auth_url, status_code=status.HTTP_302_FOUND)
@@ -113,11 +126,11 @@ async def auth_callback(
             )
         
         # Exchange authorization code for tokens
-        keycloak_tokens = keycloak_service.exchange_code_for_token(code)
+        keycloak_tokens = await keycloak_service.a_exchange_code_for_token(code)
         keycloak_access_token = keycloak_tokens["access_token"]
         
         # Get user information from KeyCloak
-        userinfo = keycloak_service.get_user_info(keycloak_access_token)
+        userinfo = await keycloak_service.a_get_user_info(keycloak_access_token)
         
         # Extract user details
         keycloak_user_id = userinfo.get("sub")  # KeyCloak user ID
@@ -183,6 +196,7 @@ async def auth_callback(
         
         db.commit()
         db.refresh(user)
+        invalidate_permission_cache(str(user.id))
         
         # Generate our application JWT tokens
         user_full_name = f"{user.first_name or ''} {user.last_name or ''}".strip() or user.email
@@ -356,12 +370,12 @@ async def get_current_user_info(
         )
 
 
-def map_keycloak_roles_to_local(keycloak_roles: list) -> list:
+def map_keycloak_roles_to_local(keycloak_roles: Iterable[str]) -> list:
     """
     Map KeyCloak roles to local application roles.
     
     Args:
-        keycloak_roles: List of role names from KeyCloak
+        keycloak_roles: Role names from KeyCloak
         
     Returns:
         List of local role names
@@ -14,7 +14,7 @@ from sqlalchemy.orm import Session
 from backend.database import get_db
 from backend.auth.dependencies import get_current_user
 from backend.auth.jwt_handler import TokenData
-from backend.services.forms import FormService
+from backend.services.forms import FormService, encode_cursor, decode_cursor
 from backend.models import Form
 
 # ============================================================================
@@ -71,10 +71,12 @@ class FormResponse(BaseModel):
 
 class FormListResponse(BaseModel):
     """Response model for form list."""
-    total: int
+    total: Optional[int] = None
     skip: int
     limit: int
     items: List[FormResponse]
+    has_more: bool = False
+    next_cursor: Optional[str] = None
 
 
 class FormListItem(BaseModel):
@@ -226,7 +228,7 @@ async def update_form(
                 detail="Form not found"
             )
         
-        return FormResponse(**FormService.get_form_with_details(db, form.id))
+        return FormResponse(**FormService.get_form_with_details(db, form_uuid))
     
     except ValueError as e:
         if "invalid literal" in str(e).lower():
@@ -281,40 +283,94 @@ async def list_forms(
     is_public: Optional[bool] = Query(None, description="Filter by public status"),
     sort_by: str = Query("created_at", regex="^(created_at|updated_at|title)$", description="Sort field"),
     sort_order: str = Query("desc", regex="^(asc|desc)$", description="Sort order"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    include_total: Optional[bool] = Query(
+        None, description="Return the total match count (default: first page only)"
+    ),
     db: Session = Depends(get_db),
 ) -> FormListResponse:
     """
     List forms with filtering, pagination, and sorting.
     
     - **skip**: Number of forms to skip (for pagination)
+    - **cursor**: Continue after a previous page (newest-first order only; skip is ignored)
     - **limit**: Max forms to return (1-100, default 20)
     - **category**: Filter by category
     - **status**: Filter by status (draft, pending_review, approved, published, archived)
     - **is_public**: Filter by public/private status
     - **sort_by**: Sort by created_at, updated_at, or title
     - **sort_order**: Sort ascending (asc) or descending (desc)
+    - **include_total**: Count all matches; defaults to the first page only,
+      since the count scans every matching form
     """
-    forms, total = FormService.list_forms(
-        db=db,
-        skip=skip,
-        limit=limit,
-        category=category,
-        status=status,
-        is_public=is_public,
-        sort_by=sort_by,
-        sort_order=sort_order,
-    )
+    if include_total is None:
+        include_total = skip == 0 and cursor is None
+    
+    newest_first = sort_by == "created_at" and sort_order == "desc"
+    
+    if cursor is not None:
+        # Keyset pagination: seek past the cursor instead of skipping rows
+        if not newest_first:
+            raise HTTPException(
+                status_code=400,  # "status" is shadowed by the query parameter
+                detail="cursor is only supported with sort_by=created_at and sort_order=desc"
+            )
+        try:
+            after = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=400,
+                detail="Invalid cursor"
+            )
+        
+        forms, next_page = FormService.list_forms_keyset(
+            db=db,
+            cursor=after,
+            limit=limit,
+            category=category,
+            status=status,
+            is_public=is_public,
+        )
+        total = None
+        if include_total:
+            total = FormService.count_forms(
+                db, category=category, status=status, is_public=is_public
+            )
+        skip = 0
+    else:
+        forms, total = FormService.list_forms(
+            db=db,
+            skip=skip,
+            limit=limit,
+            category=category,
+            status=status,
+            is_public=is_public,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            include_total=include_total,
+        )
+        # Hand out a cursor so clients can switch to keyset paging
+        next_page = None
+        if newest_first and len(forms) == limit:
+            next_page = (forms[-1].created_at, forms[-1].id)
+    
+    items = [FormResponse(**FormService.form_to_dict(form)) for form in forms]
     
-    items = [
-        FormResponse(**FormService.get_form_with_details(db, form.id))
-        for form in forms
-    ]
+    # Without a total, a full page is taken to mean more may follow
+    if cursor is not None:
+        has_more = next_page is not None
+    elif total is not None:
+        has_more = skip + len(items) < total
+    else:
+        has_more = len(items) == limit
     
     return FormListResponse(
         total=total,
         skip=skip,
         limit=limit,
         items=items,
+        has_more=has_more,
+        next_cursor=encode_cursor(next_page) if next_page else None,
     )
 
 
@@ -3,9 +3,11 @@
 from uuid import UUID
 from sqlalchemy.orm import Session
 from backend.models import User, UserRole, Role
+from backend.seeds.utils import insert_ignore
 
 
 DEMO_USER_ID = "550e8400-e29b-41d4-a716-446655440000"
+DEMO_USER_UUID = UUID(DEMO_USER_ID)
 
 
 def seed_demo_user(db: Session) -> None:
@@ -15,32 +17,32 @@ def seed_demo_user(db: Session) -> None:
     This user is used when the application is in development mode
     and a "demo-token" is used for authentication.
     """
-    # Check if demo user already exists
-    existing = db.query(User).filter_by(id=UUID(DEMO_USER_ID)).first()
-    
-    if not existing:
-        # Create demo user
-        demo_user = User(
-            id=UUID(DEMO_USER_ID),
+    # Create demo user (no-op if it already exists)
+    result = db.execute(
+        insert_ignore(db, User).values(
+            id=DEMO_USER_UUID,
             keycloak_id=DEMO_USER_ID,  # Use same UUID for Keycloak ID
             email="demo@example.com",
             first_name="Demo",
             last_name="User",
             is_active=True,
         )
-        db.add(demo_user)
-        db.flush()
-        
+    )
+    
+    if result.rowcount:
         # Assign admin role
-        admin_role = db.query(Role).filter_by(name="admin").first()
-        if admin_role:
-            user_role = UserRole(
-                user_id=demo_user.id,
-                role_id=admin_role.id
+        with db.no_autoflush:
+            admin_role_id = db.query(Role.id).filter(Role.name == "admin").scalar()
+        if admin_role_id is not None:
+            db.execute(
+                insert_ignore(db, UserRole).values(
+                    user_id=DEMO_USER_UUID,
+                    role_id=admin_role_id,
+                )
             )
-            db.add(user_role)
         
         db.commit()
         print("✓ Demo user seeded successfully")
     else:
+        db.commit()
         print("ℹ Demo user already exists")
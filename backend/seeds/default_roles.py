@@ -12,7 +12,8 @@ from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
 from backend.models import Role
-from backend.auth.permissions import DEFAULT_ROLES, Permission
+from backend.auth.permissions import DEFAULT_ROLES, DEFAULT_ROLE_PERMISSIONS, Permission
+from backend.seeds.utils import insert_ignore
 
 
 def seed_default_roles(db: Session) -> dict:
@@ -23,7 +24,7 @@ def seed_default_roles(db: Session) -> dict:
         db: Database session
         
     Returns:
-        Dictionary with counts of roles created/updated
+        Dictionary with counts of roles created/updated/unchanged
         
     Example:
         from backend.database import SessionLocal
@@ -37,50 +38,98 @@ def seed_default_roles(db: Session) -> dict:
     results = {
         "created": 0,
         "updated": 0,
+        "unchanged": 0,
         "failed": 0,
         "roles": [],
     }
     
+    # Insert missing roles in one race-safe statement; RETURNING only
+    # reports the rows that were actually created
+    try:
+        created_ids = dict(db.execute(
+            insert_ignore(db, Role).values([
+                {
+                    "name": role_name,
+                    "description": role_config["description"],
+                    "permissions": DEFAULT_ROLE_PERMISSIONS[role_name],
+                    "is_system": role_config["is_system"],
+                    "is_active": True,
+                }
+                for role_name, role_config in DEFAULT_ROLES.items()
+            ]).returning(Role.name, Role.id)
+        ).all())
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        for role_name in DEFAULT_ROLES:
+            results["failed"] += 1
+            results["roles"].append({
+                "name": role_name,
+                "status": "failed",
+                "error": str(e),
+            })
+        return results
+    
+    # Load every surviving default role in one query
+    existing_roles = {
+        role.name: role
+        for role in db.query(Role).filter(
+            Role.name.in_(list(DEFAULT_ROLES)),
+            Role.deleted_at.is_(None)
+        )
+    }
+    
     for role_name, role_config in DEFAULT_ROLES.items():
+        if role_name in created_ids:
+            results["created"] += 1
+            results["roles"].append({
+                "name": role_name,
+                "status": "created",
+                "id": str(created_ids[role_name]),
+                "permissions_count": len(role_config["permissions"]),
+            })
+            continue
+        
+        existing_role = existing_roles.get(role_name)
+        if existing_role is None:
+            # Name is held by a soft-deleted role, so the insert was skipped
+            results["failed"] += 1
+            results["roles"].append({
+                "name": role_name,
+                "status": "failed",
+                "error": "Integrity constraint violation",
+            })
+            continue
+        
+        # Already matches the defaults - nothing to write (the usual warm boot)
+        if (
+            existing_role.description == role_config["description"]
+            and existing_role.permissions == DEFAULT_ROLE_PERMISSIONS[role_name]
+            and existing_role.is_system == role_config["is_system"]
+            and existing_role.is_active
+        ):
+            results["unchanged"] += 1
+            results["roles"].append({
+                "name": role_name,
+                "status": "unchanged",
+                "id": str(existing_role.id),
+            })
+            continue
+        
         try:
-            # Check if role already exists
-            existing_role = db.query(Role).filter(
-                Role.name == role_name,
-                Role.deleted_at.is_(None)
-            ).first()
+            # Role already existed - refresh it from the defaults
+            existing_role.description = role_config["description"]
+            existing_role.permissions = DEFAULT_ROLE_PERMISSIONS[role_name]
+            existing_role.is_system = role_config["is_system"]
+            existing_role.is_active = True
+            db.commit()
+            results["updated"] += 1
+            results["roles"].append({
+                "name": role_name,
+                "status": "updated",
+                "id": str(existing_role.id),
+            })
             
-            if existing_role:
-                # Update existing role
-                existing_role.description = role_config["description"]
-                existing_role.permissions = [p.value if hasattr(p, 'value') else str(p) for p in role_config["permissions"]]
-                existing_role.is_system = role_config["is_system"]
-                existing_role.is_active = True
-                db.commit()
-                results["updated"] += 1
-                results["roles"].append({
-                    "name": role_name,
-                    "status": "updated",
-                    "id": str(existing_role.id),
-                })
-            else:
-                # Create new role
-                new_role = Role(
-                    name=role_name,
-                    description=role_config["description"],
-                    permissions=[p.value if hasattr(p, 'value') else str(p) for p in role_config["permissions"]],
-                    is_system=role_config["is_system"],
-                    is_active=True,
-                )
-                db.add(new_role)
-                db.commit()
-                results["created"] += 1
-                results["roles"].append({
-                    "name": role_name,
-                    "status": "created",
-                    "id": str(new_role.id),
-                    "permissions_count": len(role_config["permissions"]),
-                })
-                
         except IntegrityError:
             db.rollback()
             results["failed"] += 1
@@ -0,0 +1,24 @@
+"""Shared helpers for seed scripts."""
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+
+def insert_ignore(db: Session, model):
+    """
+    Build an ``INSERT ... ON CONFLICT DO NOTHING`` statement for a model.
+    
+    Lets seeders insert rows idempotently in one round-trip instead of
+    SELECT-then-INSERT, which is also safe under concurrent seeding.
+    
+    Args:
+        db: Database session (used to pick the dialect)
+        model: Mapped model class to insert into
+        
+    Returns:
+        Insert statement with ON CONFLICT DO NOTHING applied
+    """
+    if db.get_bind().dialect.name == "sqlite":
+        return sqlite_insert(model).on_conflict_do_nothing()
+    return pg_insert(model).on_conflict_do_nothing()
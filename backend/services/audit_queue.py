@@ -0,0 +1,142 @@
+"""Background audit log writer.
+
+Audit entries are queued from the request path and written in batches by a
+daemon thread, so write endpoints no longer pay for a separate audit INSERT
+and commit. Entries still in the queue are lost if the process crashes.
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+from sqlalchemy.orm import Session
+
+from backend.database import SessionLocal
+from backend.models import AuditLog
+
+logger = logging.getLogger(__name__)
+
+# Flush thresholds
+AUDIT_BATCH_SIZE = 200
+AUDIT_FLUSH_INTERVAL = 0.5  # seconds
+
+_STOP = object()
+
+
+class AuditQueue:
+    """Queue of pending audit log rows flushed by a background worker."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        batch_size: int = AUDIT_BATCH_SIZE,
+        flush_interval: float = AUDIT_FLUSH_INTERVAL,
+    ):
+        self._session_factory = session_factory
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def put(self, entry: Dict[str, Any]) -> None:
+        """
+        Queue an audit log row for writing.
+
+        Args:
+            entry: Column values for an AuditLog row
+        """
+        self._ensure_started()
+        self._queue.put_nowait(entry)
+
+    def flush(self) -> None:
+        """Block until every entry queued so far has been written."""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Flush pending entries and stop the worker thread."""
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is not None and thread.is_alive():
+            self._queue.put_nowait(_STOP)
+            thread.join(timeout)
+
+    def _ensure_started(self) -> None:
+        """Start the worker thread on first use."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="audit-log-writer",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        """Worker loop: flush when the batch is full or the interval elapses."""
+        batch: List[Dict[str, Any]] = []
+        deadline = 0.0
+        while True:
+            timeout = max(0.0, deadline - time.monotonic()) if batch else None
+            try:
+                entry = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._flush(batch)
+                batch = []
+                continue
+
+            if entry is _STOP:
+                self._flush(batch)
+                self._queue.task_done()
+                return
+
+            if not batch:
+                deadline = time.monotonic() + self._flush_interval
+            batch.append(entry)
+
+            if len(batch) >= self._batch_size:
+                self._flush(batch)
+                batch = []
+
+    def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        """Write a batch of audit rows in a single transaction."""
+        if not batch:
+            return
+
+        try:
+            self._write(batch)
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        """Insert the rows, falling back to one at a time on failure."""
+        db = self._session_factory()
+        try:
+            db.bulk_insert_mappings(AuditLog, batch)
+            db.commit()
+        except Exception:
+            db.rollback()
+            # Retry row by row so one bad entry doesn't drop the whole batch
+            for entry in batch:
+                try:
+                    db.bulk_insert_mappings(AuditLog, [entry])
+                    db.commit()
+                except Exception as e:
+                    db.rollback()
+                    logger.warning(
+                        f"Dropping audit log entry for {entry.get('entity_type')} "
+                        f"{entry.get('entity_id')}: {str(e)}"
+                    )
+        finally:
+            db.close()
+
+
+# Global audit queue instance
+audit_queue = AuditQueue()
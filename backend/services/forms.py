@@ -4,21 +4,91 @@ Provides business logic for creating, reading, updating, deleting, and managing
 Includes audit logging, soft deletes, and version management.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Tuple
 from datetime import datetime
-from uuid import UUID
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, asc, func
+from uuid import UUID, uuid4
+import base64
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy import and_, or_, desc, asc, func, tuple_
 
 from backend.models import (
     Form, FormBusinessArea, FormVersion, FormWorkflow, 
-    BusinessArea, User, AuditLog
+    BusinessArea, User
 )
+from backend.services.audit_queue import audit_queue
+
+
+# Sort lookups for list_forms (unknown values fall back to created_at desc)
+_SORT_COLUMNS = {
+    "title": Form.title,
+    "updated_at": Form.updated_at,
+    "created_at": Form.created_at,
+}
+_SORT_ORDERS = {"asc": asc, "desc": desc}
+
+# Relationships read when serializing a form; loaded up front so listing
+# a page costs a fixed number of queries instead of a few per form
+_DETAIL_LOADS = (
+    selectinload(Form.business_areas).joinedload(FormBusinessArea.business_area),
+    joinedload(Form.created_by),
+)
+
+# Single-form reads join everything into one round trip; with one form the
+# collection join only repeats that form's row once per business area
+_SINGLE_FORM_LOADS = (
+    joinedload(Form.business_areas).joinedload(FormBusinessArea.business_area),
+    joinedload(Form.created_by),
+)
+
+
+def encode_cursor(cursor: Tuple[datetime, UUID]) -> str:
+    """
+    Serialize a keyset cursor for use in a URL.
+    
+    Args:
+        cursor: (created_at, id) of the last form on a page
+        
+    Returns:
+        URL-safe cursor string
+    """
+    created_at, form_id = cursor
+    raw = f"{created_at.isoformat()}|{form_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Parse a cursor produced by encode_cursor.
+    
+    Args:
+        cursor: Cursor string from a previous page
+        
+    Returns:
+        Tuple of (created_at, id) of the last form seen
+        
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        created_at, form_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(form_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
 
 
 class FormService:
     """Service class for form management operations."""
     
+    # Scalar fields that update_form may assign directly
+    _UPDATABLE_FIELDS = frozenset({
+        "title",
+        "description",
+        "category",
+        "is_public",
+        "keywords",
+        "effective_date",
+    })
+    
     # =====================================================================
     # CREATE OPERATIONS
     # =====================================================================
@@ -103,6 +173,86 @@ class FormService:
         
         return form
     
+    @staticmethod
+    def bulk_create_forms(db: Session, rows: List[Dict[str, Any]]) -> List[Form]:
+        """
+        Create many forms in one transaction.
+        
+        The unit of work batches the form and business area INSERTs into
+        multi-row statements, instead of the commit per form that calling
+        create_form in a loop costs.
+        
+        Args:
+            db: Database session
+            rows: One dict per form with the same keys as create_form's
+                  arguments (title, description, category, is_public,
+                  keywords, business_area_ids, created_by_id, effective_date)
+            
+        Returns:
+            Created Form objects, in the order given
+            
+        Raises:
+            ValueError: If any referenced business area doesn't exist
+        """
+        # Validate every referenced business area with one query
+        wanted_ids = {ba_id for row in rows for ba_id in row.get("business_area_ids") or []}
+        if wanted_ids:
+            found_ids = {
+                ba_id for (ba_id,) in db.query(BusinessArea.id).filter(
+                    BusinessArea.id.in_(wanted_ids),
+                    BusinessArea.deleted_at.is_(None)
+                )
+            }
+            if found_ids != wanted_ids:
+                raise ValueError("One or more business areas do not exist")
+        
+        forms = []
+        for row in rows:
+            # Client-side ids let the INSERTs be batched
+            form = Form(
+                id=uuid4(),
+                title=row["title"],
+                description=row.get("description"),
+                category=row["category"],
+                is_public=row.get("is_public", False),
+                keywords=row.get("keywords") or [],
+                created_by_id=row["created_by_id"],
+                effective_date=row.get("effective_date"),
+                status='draft',
+                current_version=0,
+            )
+            form.business_areas = [
+                FormBusinessArea(id=uuid4(), business_area_id=ba_id)
+                for ba_id in row.get("business_area_ids") or []
+            ]
+            forms.append(form)
+        
+        db.add_all(forms)
+        db.commit()
+        
+        for form, row in zip(forms, rows):
+            FormService._audit_log(
+                db=db,
+                entity_type="forms",
+                entity_id=str(form.id),
+                action="CREATE",
+                user_id=row["created_by_id"],
+                new_values={
+                    "id": str(form.id),
+                    "title": row["title"],
+                    "category": row["category"],
+                    "is_public": row.get("is_public", False),
+                }
+            )
+        
+        # Reload all created forms together rather than refreshing one by one
+        form_ids = [form.id for form in forms]
+        loaded = {
+            form.id: form
+            for form in db.query(Form).options(*_DETAIL_LOADS).filter(Form.id.in_(form_ids))
+        }
+        return [loaded[form_id] for form_id in form_ids]
+    
     # =====================================================================
     # READ OPERATIONS
     # =====================================================================
@@ -134,7 +284,9 @@ class FormService:
         is_public: Optional[bool] = None,
         sort_by: str = "created_at",
         sort_order: str = "desc",
-    ) -> tuple[List[Form], int]:
+        stream: bool = False,
+        include_total: bool = False,
+    ) -> tuple[Iterable[Form], Optional[int]]:
         """
         List forms with filters and pagination.
         
@@ -147,13 +299,112 @@ class FormService:
             is_public: Filter by public status
             sort_by: Field to sort by (created_at, updated_at, title)
             sort_order: asc or desc
+            stream: Yield rows in batches via a server-side cursor instead of
+                    building a list (for export-style callers)
+            include_total: Also run COUNT(*) over the filtered forms; this
+                           scans every match, so callers should only ask
+                           for it when they display a total
             
         Returns:
-            Tuple of (list of Form objects, total count)
+            Tuple of (list or iterator of Form objects, total count or None)
+        """
+        query = FormService._filtered_query(db, category, status, is_public)
+        
+        # Count total (only on request - it costs a scan of every match)
+        total = query.count() if include_total else None
+        
+        # Apply sorting
+        sort_column = _SORT_COLUMNS.get(sort_by, Form.created_at)
+        order_fn = _SORT_ORDERS.get(sort_order.lower(), desc)
+        # id breaks ties so pages are stable and match the keyset order
+        query = query.order_by(order_fn(sort_column), order_fn(Form.id))
+        
+        # Apply pagination
+        limit = min(limit, 100)  # Max 100 per request
+        query = query.options(*_DETAIL_LOADS).offset(skip).limit(limit)
+        
+        if stream:
+            return query.execution_options(stream_results=True).yield_per(100), total
+        
+        forms = query.all()
+        
+        return forms, total
+    
+    @staticmethod
+    def list_forms_keyset(
+        db: Session,
+        cursor: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 20,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        is_public: Optional[bool] = None,
+    ) -> tuple[List[Form], Optional[Tuple[datetime, UUID]]]:
         """
+        List forms newest first using keyset pagination.
+        
+        Unlike skip/limit, each page seeks straight to the cursor position
+        on the (created_at, id) index, so deep pages cost the same as the
+        first one.
+        
+        Args:
+            db: Database session
+            cursor: (created_at, id) of the last form on the previous page,
+                    or None for the first page
+            limit: Max records to return (max 100)
+            category: Filter by category
+            status: Filter by status
+            is_public: Filter by public status
+            
+        Returns:
+            Tuple of (list of Form objects, cursor for the next page or None)
+        """
+        query = FormService._filtered_query(db, category, status, is_public)
+        
+        if cursor is not None:
+            query = query.filter(tuple_(Form.created_at, Form.id) < tuple_(*cursor))
+        
+        limit = min(limit, 100)  # Max 100 per request
+        forms = query.options(*_DETAIL_LOADS).order_by(
+            Form.created_at.desc(), Form.id.desc()
+        ).limit(limit).all()
+        
+        next_cursor = None
+        if len(forms) == limit:
+            next_cursor = (forms[-1].created_at, forms[-1].id)
+        
+        return forms, next_cursor
+    
+    @staticmethod
+    def count_forms(
+        db: Session,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        is_public: Optional[bool] = None,
+    ) -> int:
+        """
+        Count live forms matching the list filters.
+        
+        Args:
+            db: Database session
+            category: Filter by category
+            status: Filter by status
+            is_public: Filter by public status
+            
+        Returns:
+            Number of matching forms
+        """
+        return FormService._filtered_query(db, category, status, is_public).count()
+    
+    @staticmethod
+    def _filtered_query(
+        db: Session,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        is_public: Optional[bool] = None,
+    ):
+        """Build the base query of live forms with the list filters applied."""
         query = db.query(Form).filter(Form.deleted_at.is_(None))
         
-        # Apply filters
         if category:
             query = query.filter(Form.category == category)
         if status:
@@ -161,27 +412,7 @@ class FormService:
         if is_public is not None:
             query = query.filter(Form.is_public == is_public)
         
-        # Count total
-        total = query.count()
-        
-        # Apply sorting
-        if sort_by == "title":
-            sort_column = Form.title
-        elif sort_by == "updated_at":
-            sort_column = Form.updated_at
-        else:
-            sort_column = Form.created_at
-        
-        if sort_order.lower() == "asc":
-            query = query.order_by(asc(sort_column))
-        else:
-            query = query.order_by(desc(sort_column))
-        
-        # Apply pagination
-        limit = min(limit, 100)  # Max 100 per request
-        forms = query.offset(skip).limit(limit).all()
-        
-        return forms, total
+        return query
     
     # =====================================================================
     # UPDATE OPERATIONS
@@ -220,19 +451,11 @@ class FormService:
             "keywords": form.keywords,
         }
         
-        # Update fields
-        if "title" in kwargs:
-            form.title = kwargs["title"]
-        if "description" in kwargs:
-            form.description = kwargs["description"]
-        if "category" in kwargs:
-            form.category = kwargs["category"]
-        if "is_public" in kwargs:
-            form.is_public = kwargs["is_public"]
-        if "keywords" in kwargs:
-            form.keywords = kwargs["keywords"]
-        if "effective_date" in kwargs:
-            form.effective_date = kwargs["effective_date"]
+        # Update fields (only assign changed values so unchanged rows stay clean)
+        for field in FormService._UPDATABLE_FIELDS & kwargs.keys():
+            new_value = kwargs[field]
+            if getattr(form, field) != new_value:
+                setattr(form, field, new_value)
         
         # Handle business area updates
         if "business_area_ids" in kwargs:
@@ -247,14 +470,15 @@ class FormService:
                     form_ba = FormBusinessArea(business_area=ba)
                     form.business_areas.append(form_ba)
         
+        # No refresh: the committed instance is expired and reloads only if
+        # the caller reads it (the API re-reads with eager loads anyway)
         db.commit()
-        db.refresh(form)
         
         # Audit log
         FormService._audit_log(
             db=db,
             entity_type="forms",
-            entity_id=str(form.id),
+            entity_id=str(form_id),
             action="UPDATE",
             user_id=updated_by_id,
             old_values=old_values,
@@ -406,22 +630,22 @@ class FormService:
         old_values: Optional[Dict[str, Any]] = None,
         new_values: Optional[Dict[str, Any]] = None,
     ) -> None:
-        """Create an audit log entry."""
-        try:
-            audit_entry = AuditLog(
-                entity_type=entity_type,
-                entity_id=entity_id,
-                action=action,
-                user_id=user_id,
-                old_values=old_values,
-                new_values=new_values,
-            )
-            db.add(audit_entry)
-            db.commit()
-        except Exception:
-            db.rollback()
-            # Don't let audit logging failures break the app
-            pass
+        """Create an audit log entry (skipped when nothing changed)."""
+        if old_values is not None and new_values is not None and all(
+            key in old_values and old_values[key] == value
+            for key, value in new_values.items()
+        ):
+            return
+        
+        # Written in batches by the background audit writer
+        audit_queue.put({
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "action": action,
+            "user_id": user_id,
+            "old_values": old_values,
+            "new_values": new_values,
+        })
     
     @staticmethod
     def get_form_with_details(db: Session, form_id: UUID) -> Optional[Dict[str, Any]]:
@@ -435,10 +659,29 @@ class FormService:
         Returns:
             Dictionary with form details or None
         """
-        form = FormService.get_form_by_id(db, form_id)
+        form = db.query(Form).options(*_SINGLE_FORM_LOADS).filter(
+            Form.id == form_id,
+            Form.deleted_at.is_(None)
+        ).first()
         if not form:
             return None
         
+        return FormService.form_to_dict(form)
+    
+    @staticmethod
+    def form_to_dict(form: Form) -> Dict[str, Any]:
+        """
+        Serialize a form with its business areas and creator.
+        
+        Forms from list_forms / list_forms_keyset already have these
+        relationships loaded, so no further queries are issued.
+        
+        Args:
+            form: Form object
+            
+        Returns:
+            Dictionary with form details
+        """
         return {
             "id": str(form.id),
             "title": form.title,
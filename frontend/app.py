@@ -1,36 +1,229 @@
 """Simple web server for serving frontend pages with API integration."""
 
-from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import FileResponse, Response
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+import functools
+import hashlib
+import mimetypes
 import os
+import re
+import stat
+import time
+
+# Seconds between mtime checks for cached pages
+PAGE_RELOAD_INTERVAL = 5.0
+PAGE_CACHE_CONTROL = "public, max-age=60"
+
+# Static assets up to this size are served from an in-memory cache
+SMALL_ASSET_MAX_SIZE = 256 * 1024
+STATIC_IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# src="/static/..." / href="/static/..." references rewritten to hashed URLs
+STATIC_REF_RE = re.compile(rb"""((?:src|href)=["'])/static/([^"'?#]+)(["'])""")
+
+
+def is_not_modified(request: Request, etag: str, mtime: float) -> bool:
+    """
+    Check the request's conditional headers against the current version.
+
+    If-None-Match takes precedence over If-Modified-Since (RFC 9110).
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        # HTTP dates have one-second resolution
+        return int(mtime) <= since
+
+    return False
+
+
+class CachedPage:
+    """Small HTML page held in memory with precomputed response headers.
+
+    The file is re-read only when its mtime changes, and the mtime is
+    checked at most once every PAGE_RELOAD_INTERVAL seconds.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._checked_at = time.monotonic()
+        self._load()
+
+    def _load(self) -> None:
+        """Read the file and rebuild the body and headers."""
+        stat_result = os.stat(self.path)
+        with open(self.path, "rb") as f:
+            body = STATIC_REF_RE.sub(_hash_static_ref, f.read())
+
+        self.mtime = stat_result.st_mtime
+        self.body = body
+        self.etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        self.headers = {
+            "etag": self.etag,
+            "last-modified": formatdate(stat_result.st_mtime, usegmt=True),
+            "cache-control": PAGE_CACHE_CONTROL,
+        }
+
+    def _refresh(self) -> None:
+        """Reload the file if it changed on disk since the last check."""
+        now = time.monotonic()
+        if now - self._checked_at < PAGE_RELOAD_INTERVAL:
+            return
+        self._checked_at = now
+        try:
+            if os.stat(self.path).st_mtime != self.mtime:
+                self._load()
+        except OSError:
+            # Keep serving the cached copy if the file is briefly missing
+            pass
+
+    def response(self, request: Request) -> Response:
+        """Build the response, or a bodiless 304 if the client copy is current."""
+        self._refresh()
+        if is_not_modified(request, self.etag, self.mtime):
+            return Response(status_code=304, headers=self.headers)
+        return Response(content=self.body, media_type="text/html", headers=self.headers)
+
+
+@functools.lru_cache(maxsize=256)
+def read_small_asset(path: str, mtime_ns: int, size: int) -> Tuple[bytes, Dict[str, str], str]:
+    """
+    Read a small static asset synchronously and build its headers.
+
+    Keyed on mtime and size so a changed file gets a fresh cache entry.
+    Small reads are faster done inline than through the threadpool that
+    StaticFiles uses.
+
+    Returns:
+        Tuple of (body, headers, content digest)
+    """
+    with open(path, "rb") as f:
+        body = f.read()
+
+    digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+    content_type, _ = mimetypes.guess_type(path)
+    headers = {
+        "content-type": content_type or "application/octet-stream",
+        "etag": f'"{digest}"',
+        "last-modified": formatdate(mtime_ns / 1e9, usegmt=True),
+    }
+    return body, headers, digest
+
+
+def resolve_static_file(file_path: str) -> Optional[Tuple[str, os.stat_result]]:
+    """Resolve a /static path to a regular file inside the frontend directory."""
+    full_path = os.path.realpath(os.path.join(static_dir, file_path))
+    if os.path.commonpath([full_path, static_dir]) != static_dir:
+        return None
+
+    try:
+        stat_result = os.stat(full_path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(stat_result.st_mode):
+        return None
+
+    return full_path, stat_result
+
+
+def static_url(file_path: str) -> str:
+    """
+    Build a /static URL carrying the asset's content hash.
+
+    Hashed URLs are served as immutable, so browsers never revalidate them;
+    a changed file gets a new URL instead.
+    """
+    resolved = resolve_static_file(file_path)
+    if resolved is None or resolved[1].st_size > SMALL_ASSET_MAX_SIZE:
+        return f"/static/{file_path}"
+
+    full_path, stat_result = resolved
+    _, _, digest = read_small_asset(full_path, stat_result.st_mtime_ns, stat_result.st_size)
+    return f"/static/{file_path}?v={digest}"
+
+
+def _hash_static_ref(match: "re.Match[bytes]") -> bytes:
+    """Rewrite one /static reference in a page to its content-hashed URL."""
+    prefix, file_path, quote = match.groups()
+    return prefix + static_url(file_path.decode()).encode() + quote
+
 
 # Create FastAPI app for serving static files
 app = FastAPI(title="Transportation Forms Frontend")
 
 # Get the directory where this script is located
 frontend_dir = os.path.dirname(os.path.abspath(__file__))
+static_dir = os.path.realpath(frontend_dir)
+
+
+@app.api_route("/static/{file_path:path}", methods=["GET", "HEAD"], include_in_schema=False)
+async def static_file(request: Request, file_path: str, v: Optional[str] = None):
+    """Serve a static asset from the frontend directory."""
+    resolved = resolve_static_file(file_path)
+    if resolved is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+    full_path, stat_result = resolved
+
+    # Large files are streamed from disk; FileResponse hands the path to the
+    # server via http.response.pathsend when supported and handles ranges
+    if stat_result.st_size > SMALL_ASSET_MAX_SIZE:
+        return FileResponse(full_path, stat_result=stat_result)
+
+    body, headers, digest = read_small_asset(full_path, stat_result.st_mtime_ns, stat_result.st_size)
+    cache_control = STATIC_IMMUTABLE_CACHE_CONTROL if v == digest else "no-cache"
+    headers = {**headers, "cache-control": cache_control}
+    if is_not_modified(request, headers["etag"], stat_result.st_mtime):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, headers=headers)
+
+
+# Pages are small and change only at deploy time, so serve them from memory.
+# Loading at import fails fast if either page is missing from the deployment.
+INDEX_PATH = os.path.join(frontend_dir, "index.html")
+DEMO_PATH = os.path.join(frontend_dir, "form_demo.html")
+index_page = CachedPage(INDEX_PATH)
+demo_page = CachedPage(DEMO_PATH)
 
-# Mount static files
-if os.path.exists(frontend_dir):
-    app.mount("/static", StaticFiles(directory=frontend_dir), name="static")
 
 @app.get("/")
-async def root():
+async def root(request: Request):
     """Serve the main index page."""
-    index_path = os.path.join(frontend_dir, "index.html")
-    if os.path.exists(index_path):
-        return FileResponse(index_path)
-    return {"message": "Frontend index.html not found"}
+    return index_page.response(request)
+
 
 @app.get("/form-demo")
-async def form_demo():
+async def form_demo(request: Request):
     """Serve the form demo page."""
-    demo_path = os.path.join(frontend_dir, "form_demo.html")
-    if os.path.exists(demo_path):
-        return FileResponse(demo_path)
-    return {"message": "Form demo page not found"}
+    return demo_page.response(request)
+
 
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=3000)
+    certfile = os.getenv("FRONTEND_TLS_CERTFILE")
+    keyfile = os.getenv("FRONTEND_TLS_KEYFILE")
+
+    if certfile and keyfile:
+        # Browsers only speak HTTP/2 over TLS; Hypercorn negotiates h2 via ALPN
+        # so the many small /static requests share one multiplexed connection
+        import asyncio
+        from hypercorn.asyncio import serve
+        from hypercorn.config import Config
+
+        config = Config()
+        config.bind = ["0.0.0.0:3000"]
+        config.certfile = certfile
+        config.keyfile = keyfile
+        config.alpn_protocols = ["h2", "http/1.1"]
+        asyncio.run(serve(app, config))
+    else:
+        import uvicorn
+        uvicorn.run(app, host="0.0.0.0", port=3000)